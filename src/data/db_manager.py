@@ -13,6 +13,14 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# 保存测试记录时必须提供的字段
+_TEST_RECORD_REQUIRED_FIELDS = (
+    "test_task_id", "session_name", "model_name", "concurrency",
+    "total_tasks", "successful_tasks", "failed_tasks",
+    "avg_response_time", "avg_generation_speed", "total_chars",
+    "total_tokens", "avg_tps", "total_time", "current_speed"
+)
+
 class DatabaseManager:
     def __init__(self, db_path: str = "data/deepstress.db"):
         """初始化数据库管理器
@@ -515,14 +523,7 @@ class DatabaseManager:
             logger.debug(f"原始记录数据: {record}")
             
             # 验证必要字段
-            required_fields = [
-                "test_task_id", "session_name", "model_name", "concurrency",
-                "total_tasks", "successful_tasks", "failed_tasks",
-                "avg_response_time", "avg_generation_speed", "total_chars",
-                "total_tokens", "avg_tps", "total_time", "current_speed"
-            ]
-            
-            for field in required_fields:
+            for field in _TEST_RECORD_REQUIRED_FIELDS:
                 if field not in record or record[field] is None:
                     logger.error(f"缺少必要字段: {field}")
                     return False
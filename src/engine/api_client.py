@@ -67,6 +67,19 @@ class StreamStats:
 
 class APIResponse:
     """API响应数据类"""
+    # 每个请求都会创建一个实例，并在结果处理中频繁读取属性
+    __slots__ = (
+        "success",
+        "response_text",
+        "error_msg",
+        "tokens_generated",
+        "duration",
+        "start_time",
+        "end_time",
+        "model_name",
+        "stream_stats",
+    )
+
     def __init__(
         self,
         success: bool,
@@ -59,9 +59,10 @@ class TestProgress:
         """更新进度"""
         self.completed_tasks += 1
         
-        # 确保数据集统计信息存在
-        if dataset_name not in self.dataset_stats:
-            self.dataset_stats[dataset_name] = {
+        # 确保数据集统计信息存在（已存在时只做一次查找）
+        stats = self.dataset_stats.get(dataset_name)
+        if stats is None:
+            stats = self.dataset_stats[dataset_name] = {
                 "total": 0,
                 "successful": 0,
                 "failed": 0,
@@ -72,7 +73,6 @@ class TestProgress:
                 "error_count": 0  # 添加错误计数
             }
         
-        stats = self.dataset_stats[dataset_name]
         stats["total"] += 1
         
         if response.success:
@@ -56,4 +56,19 @@ class LanguageManager(QObject):
     @property
     def available_languages(self):
         """获取所有可用的语言"""
-        return self.supported_languages 
\ No newline at end of file
+        return self.supported_languages
+
+
+_language_manager = None
+
+
+def get_language_manager():
+    """获取全局语言管理器实例
+
+    直接调用LanguageManager()虽然返回同一个实例，但每次都会重新执行QObject的初始化，
+    频繁创建的组件应通过此函数获取
+    """
+    global _language_manager
+    if _language_manager is None:
+        _language_manager = LanguageManager()
+    return _language_manager
@@ -150,8 +150,10 @@ class MainWindow(QMainWindow):
     
     def connect_signals(self):
         """连接信号"""
-        # 连接测试标签页的信号到记录标签页
-        self.test_tab.test_manager.result_received.connect(self.results_tab.add_result)
+        # 记录标签页的数据由TestRecordsManager.sync_test_records同步，
+        # 不再直接订阅测试管理器的结果信号，否则结果会被重复统计
+        # 设置变更后刷新测试标签页的模型和数据集缓存
+        self.test_tab.connect_settings_signals()
         # 连接语言改变信号
         self.language_manager.language_changed.connect(self.update_ui_text)
         logger.info("信号连接完成")
@@ -7,24 +7,43 @@ from PyQt6.QtWidgets import (
     QHeaderView, QTextEdit, QPushButton, QFileDialog, QMessageBox,
     QDialog
 )
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSlot, QRunnable, QThreadPool
 from src.utils.logger import setup_logger
 from src.data.db_manager import db_manager
-from src.engine.api_client import APIResponse
 from src.engine.test_manager import TestProgress
 from src.gui.i18n.language_manager import LanguageManager
 import time
 import os
+import io
 import csv
+from dataclasses import asdict, is_dataclass
 
 logger = setup_logger("results_tab")
 
+class _LogAppendTask(QRunnable):
+    """在后台线程中把统计信息追加写入测试日志文件"""
+    def __init__(self, log_file: str, text: str):
+        super().__init__()
+        self.log_file = log_file
+        self.text = text
+
+    def run(self):
+        try:
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(self.text)
+        except Exception as e:
+            logger.error(f"写入测试日志失败: {e}")
+
 class ResultsTab(QWidget):
     """测试结果显示标签页"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.language_manager = LanguageManager()
         self.current_records = {}  # 当前测试会话的记录
+        # 单线程写日志，保证追加顺序且同一时间只有一个写入
+        self._log_pool = QThreadPool(self)
+        self._log_pool.setMaxThreadCount(1)
         self._init_ui()
         
         # 连接语言改变信号
@@ -375,11 +394,8 @@ class ResultsTab(QWidget):
             if "model_name" not in self.current_records and "model_config" in self.current_records:
                 self.current_records["model_name"] = self.current_records["model_config"]["name"]
             
-            # 创建日志文件
+            # 日志文件路径（目录由后台写入任务创建）
             log_dir = os.path.join("data", "logs", "tests")
-            os.makedirs(log_dir, exist_ok=True)
-            logger.debug(f"创建日志目录: {log_dir}")
-            
             log_file = os.path.join(log_dir, f"{self.current_records.get('test_task_id', 'unknown')}.log")
             logger.info(f"生成日志文件路径: {log_file}")
             
@@ -395,8 +411,8 @@ class ResultsTab(QWidget):
             total_time = self.current_records.get('total_time', 0)
             current_speed = self.current_records.get('current_speed', avg_generation_speed)
             
-            # 写入日志文件（使用追加模式）
-            with open(log_file, 'a', encoding='utf-8') as f:
+            # 在界面线程生成日志内容，再交给后台线程追加写入文件
+            with io.StringIO() as f:
                 # 写入测试完成信息
                 f.write("\n" + "="*50 + "\n")
                 f.write("测试完成统计信息:\n")
@@ -411,6 +427,8 @@ class ResultsTab(QWidget):
                 # 写入数据集统计信息
                 f.write("数据集统计信息:\n")
                 for dataset_name, stats in self.current_records.get('datasets', {}).items():
+                    if is_dataclass(stats):
+                        stats = asdict(stats)
                     f.write(f"\n{dataset_name}:\n")
                     f.write(f"  总任务数: {stats.get('total', 0)}\n")
                     f.write(f"  成功数: {stats.get('successful', 0)}\n")
@@ -426,8 +444,10 @@ class ResultsTab(QWidget):
                     f.write(f"{self.current_records['error_message']}\n")
                 
                 f.write("\n" + "="*50 + "\n")
+                log_text = f.getvalue()
+            self._log_pool.start(_LogAppendTask(log_file, log_text))
             
-            # 保存到数据库
+            # 保存到数据库（数据库连接只能在创建它的界面线程中使用）
             db_record = {
                 "test_task_id": self.current_records.get('test_task_id', 'unknown'),
                 "session_name": self.current_records.get('session_name', 'unknown'),
@@ -459,38 +479,6 @@ class ResultsTab(QWidget):
             logger.error(f"保存测试记录失败: {e}", exc_info=True)
             raise
 
-    def add_result(self, dataset_name: str, response: APIResponse):
-        """添加测试结果"""
-        try:
-            if dataset_name not in self.current_records["datasets"]:
-                self.current_records["datasets"][dataset_name] = {
-                    "total": 0,
-                    "successful": 0,
-                    "failed": 0,
-                    "total_time": 0.0,
-                    "total_tokens": 0,
-                    "total_chars": 0,
-                    "start_time": time.time()
-                }
-            
-            stats = self.current_records["datasets"][dataset_name]
-            stats["total"] += 1
-            
-            if response.success:
-                stats["successful"] += 1
-                stats["total_time"] += response.duration
-                stats["total_tokens"] += response.total_tokens
-                stats["total_chars"] += response.total_chars
-            else:
-                stats["failed"] += 1
-                if response.error_msg:
-                    self.error_text.append(f"数据集 {dataset_name} 错误: {response.error_msg}")
-            
-            logger.debug(f"已添加数据集 {dataset_name} 的测试结果")
-            
-        except Exception as e:
-            logger.error(f"添加测试结果失败: {e}", exc_info=True)
-
     def update_ui_text(self):
         """更新UI文本"""
         # 更新工具栏按钮文本
@@ -47,6 +47,7 @@ class SettingsTab(QWidget):
         
         # 添加GPU服务器设置
         self.gpu_settings = GPUSettingsWidget()
+        self.gpu_settings.setObjectName("gpu_settings")
         left_layout.addWidget(self.gpu_settings)
         
         # 创建右侧面板（数据集设置）
@@ -56,6 +57,7 @@ class SettingsTab(QWidget):
         
         # 添加数据集设置
         self.dataset_settings = DatasetSettingsWidget()
+        self.dataset_settings.setObjectName("dataset_settings")
         right_layout.addWidget(self.dataset_settings)
         
         # 将面板添加到分割器
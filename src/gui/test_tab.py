@@ -1,7 +1,7 @@
 """
 测试标签页模块
 """
-import asyncio
+import logging
 import time
 import uuid
 import os
@@ -37,23 +37,18 @@ from PyQt6.QtWidgets import (
     QMenu,
     QRadioButton,
     QButtonGroup)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSignalBlocker
 from PyQt6.QtGui import QFont, QAction
 from typing import List, Dict
 from src.utils.config import config
 from src.utils.logger import setup_logger
 from src.monitor.gpu_monitor import gpu_monitor
 from src.engine.test_manager import TestManager, TestTask, TestProgress
-from src.engine.api_client import APIResponse
-from src.data.test_datasets import DATASETS
 from src.data.db_manager import db_manager
-from src.data.dataset_manager import DatasetManager
-from src.gui.results_tab import ResultsTab
-from src.gui.i18n.language_manager import LanguageManager
+from src.gui.i18n.language_manager import get_language_manager
 from src.gui.widgets.gpu_monitor import GPUMonitorWidget
 from src.gui.widgets.test_info import TestInfoWidget
 from src.gui.widgets.test_progress import TestProgressWidget
-from src.gui.widgets.test_thread import TestThread
 from src.gui.widgets.dataset_list_item import DatasetListItem
 from src.gui.widgets.test_records_manager import TestRecordsManager
 from src.gui.widgets.test_executor import TestExecutor
@@ -65,11 +60,16 @@ logger = setup_logger("test_tab")
 class TestTab(QWidget):
     """测试标签页"""
 
+    SYNC_INTERVAL = 2.0  # 测试过程中同步记录到结果标签页的最小间隔（秒）
+    RESULT_FLUSH_INTERVAL = 100  # 测试结果统计合并刷新的间隔（毫秒）
+
     def __init__(self):
         super().__init__()
         
         # 获取语言管理器实例
-        self.language_manager = LanguageManager()
+        self.language_manager = get_language_manager()
+        self._tr_cache = {}  # 翻译缓存，语言切换时清空
+        self.language_manager.language_changed.connect(self._clear_tr_cache)
         
         # 初始化测试记录管理器
         self.records_manager = TestRecordsManager()
@@ -82,6 +82,24 @@ class TestTab(QWidget):
         self.model_config = None
         self.selected_datasets = {}
         self.test_manager = TestManager()  # 添加test_manager实例
+        self._dataset_widgets = {}  # QListWidgetItem -> DatasetListItem
+        self._datasets_cache = None  # 数据集名称 -> prompts，为None时从数据库重新读取
+        self._models_cache = {}  # 模型名称 -> 模型配置
+        self._results_tab = None  # _find_results_tab 的查找结果缓存
+        self._last_pct = -1  # 最近一次写入进度条的百分比
+        self._last_status = ""  # 最近一次写入状态标签的文本
+        self._last_sync_ts = 0.0  # 最近一次同步测试记录的时间（monotonic）
+        
+        # 测试结果先累加计数，由定时器合并计算平均值并刷新显示
+        self._dirty_datasets = set()
+        self._result_flush_timer = QTimer(self)
+        self._result_flush_timer.setSingleShot(True)
+        self._result_flush_timer.setInterval(self.RESULT_FLUSH_INTERVAL)
+        self._result_flush_timer.timeout.connect(self._flush_result_stats)
+        
+        # 复用同一个错误对话框，避免每次出错都新建原生窗口
+        self._err_box = QMessageBox(self)
+        self._err_box.setIcon(QMessageBox.Icon.Critical)
         
         # 初始化界面
         self.init_ui()
@@ -99,12 +117,9 @@ class TestTab(QWidget):
         # 连接语言变更信号
         self.language_manager.language_changed.connect(self.update_ui_text)
         
-        # 连接测试管理器的信号
-        self.test_manager.progress_updated.connect(self._on_progress_updated)
-        
         # 连接测试执行器的信号
         self.test_executor.progress_updated.connect(self._on_progress_updated)
-        self.test_executor.result_received.connect(self._on_result_received)
+        self.test_executor.results_received.connect(self._on_results_received)
         self.test_executor.test_finished.connect(self._on_test_finished)
         self.test_executor.test_error.connect(self._on_test_error)
         
@@ -179,35 +194,59 @@ class TestTab(QWidget):
         self.stream_mode_radio.setText(self.tr('stream_output'))
         self.direct_mode_radio.setText(self.tr('direct_output'))
         
-        # 更新其他组件的文本
-        self.gpu_monitor.update_ui_text()
-        self.progress_widget.update_ui_text()
-        self.info_widget.update_ui_text()
-        
-        # 更新数据集列表项的文本
-        for i in range(self.dataset_list.count()):
-            item = self.dataset_list.item(i)
-            if item:
-                dataset_widget = self.dataset_list.itemWidget(item)
-                if dataset_widget:
-                    dataset_widget.update_ui_text()
+        # 子组件（GPU监控、进度、测试信息、数据集列表项）在构造时和
+        # language_changed 信号触发时会自行更新文本，这里不再重复调用
     
     def tr(self, key):
         """翻译文本"""
-        return self.language_manager.get_text(key)
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.language_manager.get_text(key)
+            self._tr_cache[key] = text
+        return text
+
+    def _clear_tr_cache(self, *_):
+        """清空翻译缓存"""
+        self._tr_cache.clear()
+    
+    def _show_error(self, title: str, message: str):
+        """显示错误对话框
+
+        使用open()而不是exec()，不启动嵌套事件循环，对话框显示期间
+        已排队的测试信号仍能及时处理。对话框尚未关闭时又出现新错误，
+        则把新错误追加到已有内容之后，避免前一条错误被覆盖
+        """
+        if self._err_box.isVisible():
+            self._err_box.setText(f"{self._err_box.text()}\n\n{message}")
+            return
+        self._err_box.setWindowTitle(title)
+        self._err_box.setText(message)
+        self._err_box.open()
+    
+    def _set_status(self, text: str, style: str = None):
+        """设置状态标签，与进度更新共用缓存，文本未变化时跳过"""
+        if text != self._last_status:
+            self._last_status = text
+            self.progress_widget.status_label.setText(text)
+        if style is not None:
+            self.progress_widget.status_label.setStyleSheet(style)
+    
+    def _set_progress_pct(self, percentage: int):
+        """设置进度条百分比，与进度更新共用缓存，数值未变化时跳过"""
+        if percentage != self._last_pct:
+            self._last_pct = percentage
+            self.progress_widget.progress_bar.setValue(percentage)
     
     def _clear_test_state(self):
         """清除测试状态"""
         try:
             # 清理UI状态
-            self.progress_widget.status_label.setText(
-                self.tr('status_not_started'))
-            self.progress_widget.status_label.setStyleSheet(
-                "font-weight: bold;")
-            self.progress_widget.progress_bar.setValue(0)
-            self.progress_widget.detail_text.clear()
-            self.progress_widget.detail_text.setPlaceholderText(
-                self.tr('test_progress_placeholder'))
+            self._set_status(self.tr('status_not_started'), "font-weight: bold;")
+            self._set_progress_pct(0)
+            self._last_sync_ts = 0.0
+            self._result_flush_timer.stop()
+            self._dirty_datasets.clear()
+            self.progress_widget.clear_details()
             
             # 清理测试信息
             self.info_widget.clear()
@@ -232,9 +271,12 @@ class TestTab(QWidget):
             
             # 使用记录管理器同步测试记录
             self.records_manager.sync_test_records(results_tab)
+            self._last_sync_ts = time.monotonic()
                 
         except Exception as e:
-            logger.error(f"同步测试记录时出错: {e}", exc_info=True)
+            logger.error(
+                "同步测试记录时出错: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG))
     
     def init_ui(self):
         """初始化UI"""
@@ -274,6 +316,8 @@ class TestTab(QWidget):
         # 设置多选模式
         self.dataset_list.setSelectionMode(
             QAbstractItemView.SelectionMode.MultiSelection)
+        # 所有行使用相同的DatasetListItem布局，高度一致，视图无需逐行计算大小
+        self.dataset_list.setUniformItemSizes(True)
         dataset_layout.addWidget(self.dataset_list)
         
         self.dataset_group.setLayout(dataset_layout)
@@ -355,16 +399,9 @@ class TestTab(QWidget):
         layout.addWidget(self.info_widget)
         
         self.setLayout(layout)
-        
-        # 加载数据
-        self.load_datasets()
-        self.load_models()
-        
+
         # 更新状态
-        self.progress_widget.status_label.setText(
-            self.tr('status_not_started'))
-        self.progress_widget.detail_text.setPlaceholderText(
-            self.tr('test_progress_placeholder'))
+        self._set_status(self.tr('status_not_started'))
         
         
         # 清除测试状态
@@ -388,6 +425,16 @@ class TestTab(QWidget):
                     else:
                         logger.warning("未找到模型设置组件")
                     
+                    # 查找数据集设置组件
+                    dataset_settings = settings_tab.findChild(
+                        QWidget, "dataset_settings")
+                    if dataset_settings:
+                        dataset_settings.dataset_updated.connect(
+                            self._on_datasets_updated)
+                        logger.info("成功连接数据集更新信号")
+                    else:
+                        logger.warning("未找到数据集设置组件")
+                    
                     # 查找GPU设置组件
                     gpu_settings = settings_tab.findChild(
                         QWidget, "gpu_settings")
@@ -404,6 +451,10 @@ class TestTab(QWidget):
         except Exception as e:
             logger.error(f"连接设置信号失败: {e}")
 
+    def _on_datasets_updated(self):
+        """数据集内容变化后，下次开始测试时重新读取prompts"""
+        self._datasets_cache = None
+
     def _on_gpu_settings_updated(self):
         """处理GPU设置更新"""
         try:
@@ -417,79 +468,96 @@ class TestTab(QWidget):
     def load_datasets(self):
         """加载数据集列表"""
         try:
-            # 清空现有列表
-            self.dataset_list.clear()
-            
-            # 加载数据集
-            datasets = db_manager.get_datasets()
-            for dataset in datasets:
-                logger.info("数据集 " + dataset['name'] + " 初始化完成，默认权重: " + str(dataset.get('weight', 1)))
-                
-                # 创建列表项
-                list_item = QListWidgetItem(self.dataset_list)
-                self.dataset_list.addItem(list_item)
+            # 批量填充期间暂停重绘和信号，避免每项触发一次布局
+            self.dataset_list.setUpdatesEnabled(False)
+            self.dataset_list.blockSignals(True)
+            try:
+                # 清空现有列表
+                self.dataset_list.clear()
+                self._dataset_widgets.clear()
                 
-                # 创建数据集列表项
-                logger.info("创建数据集列表项: " + dataset['name'])
-                list_widget = DatasetListItem(dataset['name'])
-                list_item.setSizeHint(list_widget.sizeHint())  # 设置合适的大小
-                self.dataset_list.setItemWidget(list_item, list_widget)
+                # 加载数据集，同时缓存prompts供开始测试时使用
+                datasets = db_manager.get_datasets()
+                self._datasets_cache = {d["name"]: d["prompts"] for d in datasets}
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                row_size = None  # 各行布局相同，只计算一次大小
+                for dataset in datasets:
+                    if debug_enabled:
+                        logger.debug("创建数据集列表项: %s, 默认权重: %s",
+                                     dataset['name'], dataset.get('weight', 1))
+                    
+                    # 创建列表项（传入父列表时已自动加入列表）
+                    list_item = QListWidgetItem(self.dataset_list)
+                    
+                    # 创建数据集列表项
+                    list_widget = DatasetListItem(dataset['name'])
+                    if row_size is None:
+                        row_size = list_widget.sizeHint()
+                    list_item.setSizeHint(row_size)  # 设置合适的大小
+                    self.dataset_list.setItemWidget(list_item, list_widget)
+                    self._dataset_widgets[list_item] = list_widget
+            finally:
+                self.dataset_list.blockSignals(False)
+                self.dataset_list.setUpdatesEnabled(True)
             
             logger.info("数据集列表加载完成")
             
         except Exception as e:
             logger.error(f"加载数据集列表失败: {e}", exc_info=True)
-            QMessageBox.critical(self, self.tr('error'), f"加载数据集列表失败: {e}")
+            self._show_error(self.tr('error'), f"加载数据集列表失败: {e}")
     
     def load_models(self):
         """加载模型配置"""
         try:
-            # 清空当前列表
-            self.model_combo.clear()
-            
             # 从数据库获取模型配置
             models = db_manager.get_model_configs()
+            self._models_cache = {m["name"]: m for m in models}
+            current_name = self.model_combo.currentText()
+            
+            self.model_combo.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.model_combo):
+                    # 清空当前列表并批量添加
+                    self.model_combo.clear()
+                    if models:
+                        self.model_combo.addItems(list(self._models_cache))
+                        # 刷新后保持原来选中的模型
+                        index = self.model_combo.findText(current_name)
+                        if index >= 0:
+                            self.model_combo.setCurrentIndex(index)
+            finally:
+                self.model_combo.setUpdatesEnabled(True)
+            
             if models:
-                for model in models:
-                    self.model_combo.addItem(model["name"])
                 logger.info(f"已加载 {len(models)} 个模型配置")
             else:
                 logger.warning("未找到模型配置")
         except Exception as e:
             logger.error(f"加载模型配置失败: {e}")
-            QMessageBox.critical(self, "错误", f"加载模型配置失败：{e}")
+            self._show_error("错误", f"加载模型配置失败：{e}")
     
     def get_selected_model(self) -> dict:
         """获取选中的模型配置"""
-        model_name = self.model_combo.currentText()
-        if not model_name:
-            return None
-            
-        models = db_manager.get_model_configs()
-        return next((m for m in models if m["name"] == model_name), None)
+        return self._models_cache.get(self.model_combo.currentText())
     
     def get_selected_datasets(self) -> dict:
         """获取选中的数据集及其权重"""
-        logger.info("开始获取选中的数据集...")
+        logger.debug("开始获取选中的数据集...")
         selected_datasets = {}
         
         try:
-            # 获取所有数据集
-            all_datasets = {d["name"]: d["prompts"]
-                            for d in db_manager.get_datasets()}
-            
-            # 遍历所有列表项
-            for i in range(self.dataset_list.count()):
-                item = self.dataset_list.item(i)
-                if not item:
-                    continue
-                
-                # 检查是否被选中
-                if not item.isSelected():
-                    continue
-                
+            # 获取所有数据集（数据集设置变化后才重新读取）
+            if self._datasets_cache is None:
+                self._datasets_cache = {d["name"]: d["prompts"]
+                                        for d in db_manager.get_datasets()}
+            all_datasets = self._datasets_cache
+            
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            # 只遍历被选中的列表项
+            for item in self.dataset_list.selectedItems():
                 # 获取对应的 DatasetListItem widget
-                dataset_widget = self.dataset_list.itemWidget(item)
+                dataset_widget = self._dataset_widgets.get(item)
                 if not dataset_widget:
                     continue
                 
@@ -499,14 +567,16 @@ class TestTab(QWidget):
                 if weight > 0 and dataset_name in all_datasets:
                     prompts = all_datasets[dataset_name]
                     selected_datasets[dataset_name] = (prompts, weight)
-                    logger.info("添加数据集: " + dataset_name + ", prompts数量: " + str(len(prompts)) + ", 权重: " + str(weight))
+                    if debug_enabled:
+                        logger.debug("添加数据集: %s, prompts数量: %d, 权重: %d",
+                                     dataset_name, len(prompts), weight)
             
-            logger.info("最终选中的数据集: " + str(list(selected_datasets.keys())))
+            logger.info("最终选中的数据集: %s", list(selected_datasets))
             return selected_datasets
             
         except Exception as e:
             logger.error(f"获取选中数据集失败: {e}")
-            QMessageBox.critical(self, "错误", f"获取选中数据集失败：{e}")
+            self._show_error("错误", f"获取选中数据集失败：{e}")
             return {}
     
     def start_test(self):
@@ -521,9 +591,7 @@ class TestTab(QWidget):
             self._clear_test_state()
             
             # 更新状态为开始测试
-            self.progress_widget.status_label.setText("状态: 开始测试")
-            self.progress_widget.status_label.setStyleSheet(
-                "font-weight: bold; color: blue;")
+            self._set_status("状态: 开始测试", "font-weight: bold; color: blue;")
             
             # 获取选中的模型配置
             model_config = self.get_selected_model()
@@ -538,7 +606,7 @@ class TestTab(QWidget):
                 return
             
             # 生成测试任务ID
-            test_task_id = time.strftime("test_%Y%m%d_%H%M%S")
+            test_task_id = f"test_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
             self.test_task_id = test_task_id
             
             # 获取并发设置
@@ -549,20 +617,10 @@ class TestTab(QWidget):
             records = self.records_manager.init_test_records(
                 test_task_id, model_config, selected_datasets, total_concurrency)
             
-            # 计算总权重
-            total_weight = sum(
-                weight for _,
-                weight in selected_datasets.values())
-            logger.info(f"总权重: {total_weight}")
-            
-            # 根据权重分配并发数并创建测试任务
+            # 按测试记录中已分配好的并发数创建测试任务
             tasks = []
             for dataset_name, (prompts, weight) in selected_datasets.items():
-                # 计算分配的并发数
-                dataset_concurrency = max(
-                    1, int((weight / total_weight) * total_concurrency))
-                logger.info(
-                    f"数据集 {dataset_name} 配置: 权重={weight}, 并发数={dataset_concurrency}")
+                dataset_concurrency = records["datasets"][dataset_name].concurrency
                 
                 # 创建测试任务 - 使用并发数作为任务数
                 task = TestTask(
@@ -583,7 +641,7 @@ class TestTab(QWidget):
             # 初始化每个数据集的显示状态
             for dataset_name, dataset_stats in records["datasets"].items():
                 # 确保初始状态也正确显示并发数
-                dataset_stats["avg_generation_speed"] = 0  # 初始速度为0
+                dataset_stats.avg_generation_speed = 0  # 初始速度为0
                 self.info_widget.update_dataset_info(
                     dataset_name, dataset_stats)
             
@@ -591,19 +649,23 @@ class TestTab(QWidget):
             success = self.test_executor.start_test(
                 model_config["name"],
                 tasks,
-                test_task_id
+                test_task_id,
+                test_manager=self.test_manager,
+                model_config=model_config
             )
             
             if not success:
-                QMessageBox.critical(self, "错误", "启动测试失败")
+                self._show_error("错误", "启动测试失败")
                 self._clear_test_state()
                 return
             
+            # 测试期间加快GPU监控的采样
+            self.gpu_monitor.set_test_running(True)
             logger.info("测试线程开始运行")
             
         except Exception as e:
             logger.error(f"启动测试失败: {e}", exc_info=True)
-            QMessageBox.critical(self, "错误", f"启动测试失败: {e}")
+            self._show_error("错误", f"启动测试失败: {e}")
             self._clear_test_state()
     
     def stop_test(self):
@@ -615,11 +677,10 @@ class TestTab(QWidget):
             
             # 停止测试
             self.test_executor.stop_test()
+            self.gpu_monitor.set_test_running(False)
             
             # 更新UI状态
-            self.progress_widget.status_label.setText("状态: 已停止")
-            self.progress_widget.status_label.setStyleSheet(
-                "font-weight: bold; color: red;")
+            self._set_status("状态: 已停止", "font-weight: bold; color: red;")
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             
@@ -629,17 +690,19 @@ class TestTab(QWidget):
     
     def _on_progress_updated(self, progress: TestProgress):
         """处理进度更新"""
+        # 测试已停止后仍在队列中的进度信号不再处理，避免覆盖最终状态
+        if not self.test_executor.is_test_running():
+            return
         try:
             # 计算总体进度百分比
             total = progress.total_tasks
             completed = progress.successful_tasks + progress.failed_tasks
             if total > 0:
-                percentage = int((completed / total) * 100)
-                self.progress_widget.progress_bar.setValue(percentage)
+                self._set_progress_pct(int((completed / total) * 100))
             
             # 更新状态标签
-            status_text = self.tr('completed') + ": " + str(completed) + "/" + str(total)
-            self.progress_widget.status_label.setText(status_text)
+            self._set_status(
+                self.tr('completed') + ": " + str(completed) + "/" + str(total))
             
             # 更新统计信息
             current_records = self.records_manager.current_test_records
@@ -647,50 +710,32 @@ class TestTab(QWidget):
                 current_records["successful_tasks"] = progress.successful_tasks
                 current_records["failed_tasks"] = progress.failed_tasks
                 
-                # 只在每10个任务完成时同步一次记录
-                if completed % 10 == 0:
+                # 按时间间隔同步记录（会写盘），测试结束或出错时另行强制同步
+                if time.monotonic() - self._last_sync_ts >= self.SYNC_INTERVAL:
                     self._sync_test_records()
-                
-                # 每次进度更新时，实时更新数据集信息显示
-                for dataset_name, dataset_stats in current_records["datasets"].items():
-                    self.info_widget.update_dataset_info(dataset_name, dataset_stats)
-            
-            # 更新详细信息
-            detail_text = ""
-            # 添加测试任务ID
-            detail_text += self.tr('test_task_id') + ": " + progress.test_task_id + "\n"
+                # 数据集信息只在收到新结果时由 _flush_result_stats 按数据集刷新
             
-            # 添加完成情况
-            detail_text += self.tr('completed') + ": " + str(completed) + "/" + str(total) + "\n"
-            
-            # 添加成功率
+            # 更新详细信息（只有数值变化的字段才会重绘）
+            set_detail = self.progress_widget.set_detail
+            set_detail('test_task_id', progress.test_task_id)
+            set_detail('completed', f"{completed}/{total}")
             if total > 0:
                 success_rate = (progress.successful_tasks / total) * 100
-                detail_text += self.tr('success_rate') + f": {success_rate:.1f}%\n"
-            
-            # 添加平均响应时间
-            detail_text += self.tr('avg_response_time') + f": {progress.avg_response_time:.2f}s\n"
-            
-            # 添加平均生成速度
-            detail_text += self.tr('avg_generation_speed') + f": {progress.avg_generation_speed:.1f}字/秒\n"
-            
-            # 添加当前速度
-            detail_text += self.tr('current_speed') + f": {progress.current_speed:.1f}字/秒\n"
-            
-            # 添加平均TPS
-            detail_text += self.tr('avg_tps') + f": {progress.avg_tps:.1f}\n"
-            
-            # 添加最后一次错误信息
-            if progress.last_error:
-                detail_text += self.tr('last_error') + ": " + progress.last_error
-            
-            self.progress_widget.detail_text.setText(detail_text)
+                set_detail('success_rate', f"{success_rate:.1f}%")
+            set_detail('avg_response_time', f"{progress.avg_response_time:.2f}s")
+            set_detail('avg_generation_speed', f"{progress.avg_generation_speed:.1f}字/秒")
+            set_detail('current_speed', f"{progress.current_speed:.1f}字/秒")
+            set_detail('avg_tps', f"{progress.avg_tps:.1f}")
+            set_detail('last_error', progress.last_error or "")
             
         except Exception as e:
-            logger.error(f"更新进度时出错: {e}", exc_info=True)
+            logger.error(
+                "更新进度时出错: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def _on_test_finished(self):
         """测试完成处理"""
+        self.gpu_monitor.set_test_running(False)
         try:
             # 获取当前测试记录
             current_records = self.records_manager.current_test_records
@@ -699,12 +744,12 @@ class TestTab(QWidget):
             
             # 更新测试状态
             current_records["status"] = "completed"
+            self.records_manager.mark_changed()
+            self._flush_result_stats()
             
             # 更新UI状态
-            self.progress_widget.status_label.setText("状态: 已完成")
-            self.progress_widget.status_label.setStyleSheet(
-                "font-weight: bold; color: green;")
-            self.progress_widget.progress_bar.setValue(100)
+            self._set_status("状态: 已完成", "font-weight: bold; color: green;")
+            self._set_progress_pct(100)
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             
@@ -718,6 +763,7 @@ class TestTab(QWidget):
     
     def _on_test_error(self, error_msg: str):
         """测试错误处理"""
+        self.gpu_monitor.set_test_running(False)
         try:
             # 获取当前测试记录
             current_records = self.records_manager.current_test_records
@@ -726,11 +772,12 @@ class TestTab(QWidget):
             
             # 更新测试状态
             current_records["status"] = "error"
+            self.records_manager.mark_changed()
+            self._flush_result_stats()
             
             # 更新UI状态
-            self.progress_widget.status_label.setText(f"状态: 错误 - {error_msg}")
-            self.progress_widget.status_label.setStyleSheet(
-                "font-weight: bold; color: red;")
+            self._set_status(
+                f"状态: 错误 - {error_msg}", "font-weight: bold; color: red;")
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             
@@ -746,7 +793,12 @@ class TestTab(QWidget):
             logger.error(f"处理测试错误时出错: {e}", exc_info=True)
 
     def _find_results_tab(self):
-        """查找results_tab组件"""
+        """查找results_tab组件，找到后缓存，组件销毁时失效"""
+        if self._results_tab is not None:
+            return self._results_tab
+        
+        # 只在同步记录时才需要，延迟导入以缩短本模块的导入时间
+        from src.gui.results_tab import ResultsTab
         try:
             # 遍历所有父窗口直到找到主窗口
             parent = self.parent()
@@ -762,6 +814,8 @@ class TestTab(QWidget):
                         tab = tab_widget.widget(i)
                         if isinstance(tab, ResultsTab):
                             logger.debug("成功找到results_tab组件")
+                            self._results_tab = tab
+                            tab.destroyed.connect(self._on_results_tab_destroyed)
                             return tab
             
             logger.error("未找到results_tab组件")
@@ -770,87 +824,118 @@ class TestTab(QWidget):
             logger.error(f"查找results_tab组件时出错: {e}")
             return None
 
-    def _on_result_received(self, dataset_name: str, response: APIResponse):
-        """处理测试结果"""
+    def _on_results_tab_destroyed(self, *_):
+        """结果标签页被销毁时清除缓存"""
+        self._results_tab = None
+
+    def _on_results_received(self, results: list):
+        """处理测试线程分批发送的测试结果
+
+        这里只累加计数，平均值的计算和界面刷新由 _flush_result_stats 定时合并处理
+        """
         try:
             # 获取当前测试记录
             current_records = self.records_manager.current_test_records
             if not current_records:
                 return
             
-            dataset_stats = current_records["datasets"].get(dataset_name)
-            if not dataset_stats:
-                return
-                
-            if response.success:
-                dataset_stats["successful"] += 1
-                dataset_stats["total_tokens"] += response.total_tokens
-                dataset_stats["total_chars"] += response.total_chars
+            # 整批结果共用的对象绑定到局部变量
+            datasets = current_records["datasets"]
+            start_monotonic = current_records["start_monotonic"]
+            dirty = self._dirty_datasets
+            successful = failed = total_tokens = total_chars = 0
+            current_speed = None
+            now = time.monotonic()
+            
+            for dataset_name, response in results:
+                try:
+                    dataset_stats = datasets[dataset_name]
+                except KeyError:
+                    continue
                 
-                # 更新平均值
-                if dataset_stats["successful"] > 0:
+                if response.success:
+                    duration = response.duration
+                    tokens = response.total_tokens
+                    chars = response.total_chars
+                    # 当前速度使用单次响应的速度
+                    current_speed = chars / duration if duration > 0 else 0
+                    
+                    dataset_stats.successful += 1
+                    dataset_stats.total_tokens += tokens
+                    dataset_stats.total_chars += chars
+                    dataset_stats.current_speed = current_speed
                     # 计算实际耗时
-                    current_time = time.time()
-                    dataset_stats["total_time"] = current_time - \
-                        dataset_stats["start_time"]
+                    dataset_stats.total_time = now - dataset_stats.start_time
                     
-                    if dataset_stats["total_time"] > 0:
-                        # 考虑并发数计算平均生成速度
-                        dataset_stats["avg_generation_speed"] = (
-                            dataset_stats["total_chars"] / dataset_stats["total_time"] / 
-                            dataset_stats["concurrency"]  # 除以并发数
-                        )
-                        # 当前速度仍然使用单次响应的速度
-                        dataset_stats["current_speed"] = (
-                            response.total_chars / response.duration
-                            if response.duration > 0 else 0
-                        )
-                        # 考虑并发数计算TPS
-                        dataset_stats["avg_tps"] = (
-                            dataset_stats["total_tokens"] / dataset_stats["total_time"] / 
-                            dataset_stats["concurrency"]  # 除以并发数
-                        )
-                
-                # 更新总体统计
-                current_records["successful_tasks"] += 1
-                current_records["total_tokens"] += response.total_tokens
-                current_records["total_chars"] += response.total_chars
-                
-                # 计算总体实际耗时和平均值
-                current_time = time.time()
-                current_records["total_time"] = current_time - \
-                    current_records["start_time"]
-                
-                if current_records["successful_tasks"] > 0:
-                    if current_records["total_time"] > 0:
-                        # 考虑总并发数计算总体平均生成速度
-                        current_records["avg_generation_speed"] = (
-                            current_records["total_chars"] / 
-                            current_records["total_time"] / 
-                            current_records["concurrency"]  # 除以总并发数
-                        )
-                        # 当前速度仍然使用单次响应的速度
-                        current_records["current_speed"] = (
-                            response.total_chars / response.duration
-                            if response.duration > 0 else 0
-                        )
-                        # 考虑总并发数计算总体TPS
-                        current_records["avg_tps"] = (
-                            current_records["total_tokens"] / 
-                            current_records["total_time"] / 
-                            current_records["concurrency"]  # 除以总并发数
-                        )
-            else:
-                dataset_stats["failed"] += 1
-                current_records["failed_tasks"] += 1
+                    successful += 1
+                    total_tokens += tokens
+                    total_chars += chars
+                else:
+                    dataset_stats.failed += 1
+                    failed += 1
+                dirty.add(dataset_name)
+            
+            if not successful and not failed:
+                return
             
-            # 更新信息显示
-            self.info_widget.update_dataset_info(dataset_name, dataset_stats)
+            # 更新总体统计
+            current_records["successful_tasks"] += successful
+            current_records["failed_tasks"] += failed
+            if successful:
+                current_records["total_tokens"] += total_tokens
+                current_records["total_chars"] += total_chars
+                current_records["current_speed"] = current_speed
+                current_records["total_time"] = now - start_monotonic
+            
+            # 标记待刷新，合并一段时间内的结果统一计算和显示
+            self.records_manager.mark_changed()
+            if not self._result_flush_timer.isActive():
+                self._result_flush_timer.start()
             
         except Exception as e:
             # 只记录错误，不影响测试继续进行
             logger.error(f"处理测试结果时出错: {e}")
 
+    def _flush_result_stats(self):
+        """根据累计的计数计算平均值，并刷新有新结果的数据集的显示"""
+        self._result_flush_timer.stop()
+        dirty, self._dirty_datasets = self._dirty_datasets, set()
+        if not dirty:
+            return
+        try:
+            current_records = self.records_manager.current_test_records
+            if not current_records:
+                return
+            
+            for dataset_name in dirty:
+                dataset_stats = current_records["datasets"].get(dataset_name)
+                if not dataset_stats:
+                    continue
+                
+                if dataset_stats.successful > 0 and dataset_stats.total_time > 0:
+                    # 考虑并发数计算平均生成速度和TPS（除以耗时和并发数）
+                    scale = 1.0 / (
+                        dataset_stats.total_time * dataset_stats.concurrency)
+                    dataset_stats.avg_generation_speed = (
+                        dataset_stats.total_chars * scale)
+                    dataset_stats.avg_tps = dataset_stats.total_tokens * scale
+                
+                # 更新信息显示
+                self.info_widget.update_dataset_info(dataset_name, dataset_stats)
+            
+            if (current_records["successful_tasks"] > 0
+                    and current_records["total_time"] > 0):
+                # 考虑总并发数计算总体平均生成速度和TPS（除以耗时和总并发数）
+                scale = 1.0 / (
+                    current_records["total_time"] * current_records["concurrency"])
+                current_records["avg_generation_speed"] = (
+                    current_records["total_chars"] * scale)
+                current_records["avg_tps"] = (
+                    current_records["total_tokens"] * scale)
+            
+        except Exception as e:
+            logger.error(f"刷新测试统计时出错: {e}")
+
     def _on_dataset_clicked(self, item):
         """处理数据集列表项的点击事件"""
         # 切换选择状态
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QSizePolicy
 )
 from PyQt6.QtCore import Qt
-from src.gui.i18n.language_manager import LanguageManager
+from src.gui.i18n.language_manager import get_language_manager
 from src.utils.logger import setup_logger
 
 # 设置日志记录器
@@ -31,12 +31,14 @@ class DatasetListItem(QWidget):
     def __init__(self, dataset_name: str, parent=None):
         super().__init__(parent)
         self.dataset_name = dataset_name
-        self.language_manager = LanguageManager()
+        self.language_manager = get_language_manager()
+        self._tr_cache = {}  # 翻译缓存，语言切换时清空
+        self.language_manager.language_changed.connect(self._clear_tr_cache)
         self.init_ui()
         
         # 连接语言改变信号
         self.language_manager.language_changed.connect(self.update_ui_text)
-        logger.info(f"创建数据集列表项: {dataset_name}")
+        logger.debug("创建数据集列表项: %s", dataset_name)
     
     def init_ui(self):
         """初始化UI"""
@@ -72,11 +74,19 @@ class DatasetListItem(QWidget):
         layout.addWidget(self.weight_label)
         
         self.setLayout(layout)
-        logger.info(f"数据集 {self.dataset_name} 初始化完成，默认权重: 1")
+        logger.debug("数据集 %s 初始化完成，默认权重: 1", self.dataset_name)
     
     def tr(self, key):
         """翻译文本"""
-        return self.language_manager.get_text(key)
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.language_manager.get_text(key)
+            self._tr_cache[key] = text
+        return text
+
+    def _clear_tr_cache(self, *_):
+        """清空翻译缓存"""
+        self._tr_cache.clear()
     
     def get_translated_name(self):
         """获取翻译后的数据集名称"""
@@ -12,17 +12,17 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QProgressBar,
     QSizePolicy,
-    QFormLayout,
     QStackedWidget,
     QGridLayout,
     QLineEdit,
     QMessageBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont
 from src.utils.logger import setup_logger
 from src.monitor.gpu_monitor import gpu_monitor
-from src.gui.i18n.language_manager import LanguageManager
+from src.utils.config import config
+from src.gui.i18n.language_manager import get_language_manager
 
 # 设置日志记录器
 logger = setup_logger("gpu_monitor")
@@ -31,70 +31,152 @@ logger = setup_logger("gpu_monitor")
 class MonitorThread(QThread):
     """GPU监控线程"""
     stats_updated = pyqtSignal(object)  # 数据更新信号
-    server_config_needed = pyqtSignal()  # 请求服务器配置信号
     
-    def __init__(self, update_interval=0.5):
+    FAILURE_BACKOFF_COUNT = 3  # 连续采集失败多少次后放慢轮询
+    FAILURE_BACKOFF_FACTOR = 4  # 采集持续失败时轮询间隔的放大倍数
+    
+    def __init__(self, update_interval=2.0):
         super().__init__()
-        self.update_interval = update_interval
+        self.update_interval = update_interval  # 当前期望的轮询间隔（秒），可由主线程修改
+        self._timer = None
+        self._failures = 0  # 连续采集失败次数
         self.running = False
+        self.paused = False  # 暂停时不采集数据，线程保持运行
         self._last_stats = None
         self._active_server = None
-        self._initialized = False  # 添加初始化标志
+        self._last_state = None  # 最近一次状态: "no-server" / "ok" / "error"
     
     def set_active_server(self, server_config):
         """从主线程设置活动服务器配置"""
         if server_config != self._active_server:  # 只在配置变化时更新
             self._active_server = server_config
-            self._initialized = False  # 重置初始化标志
+            self._last_state = None  # 配置变化后重新通知状态
+            self._failures = 0
             if server_config:
                 logger.info(f"监控线程收到新的服务器配置: {server_config['name']}")
             else:
                 logger.info("监控线程收到空服务器配置")
     
+    def set_update_interval(self, seconds):
+        """从主线程设置轮询间隔，在下一次轮询时生效"""
+        self.update_interval = seconds
+
+    def _apply_interval(self):
+        """按期望间隔和失败次数调整定时器（在监控线程中调用）"""
+        interval = self.update_interval
+        if self._failures >= self.FAILURE_BACKOFF_COUNT:
+            # 服务器不可达时每次采集都要等待SSH超时，放慢轮询
+            interval *= self.FAILURE_BACKOFF_FACTOR
+        interval_ms = int(interval * 1000)
+        if self._timer is not None and self._timer.interval() != interval_ms:
+            self._timer.setInterval(interval_ms)
+
     def get_last_stats(self):
         """获取最近一次的统计数据"""
         return self._last_stats
     
     def run(self):
-        """运行监控循环"""
+        """运行监控事件循环，由定时器驱动轮询"""
         self.running = True
-        while self.running:
-            try:
-                if not self._initialized:  # 只在未初始化时请求配置
-                    self.server_config_needed.emit()
-                    self._initialized = True
-                
-                if self._active_server:
-                    stats = gpu_monitor.get_stats()
-                    if stats and stats != self._last_stats:
-                        self._last_stats = stats
-                        self.stats_updated.emit(stats)
+        self._timer = QTimer()
+        # 使用直接连接，让轮询在监控线程中执行，而不是排队回到界面线程
+        self._timer.timeout.connect(
+            self._poll, Qt.ConnectionType.DirectConnection)
+        self._timer.start(int(self.update_interval * 1000))
+        self._poll()  # 启动后立即采集一次
+        if self.running:
+            self.exec()
+        self._timer.stop()
+        self._timer = None
+    
+    def _poll(self):
+        """采集一次监控数据"""
+        if self.paused:
+            return
+        try:
+            if self._active_server:
+                # 每次get_stats都会通过SSH重新采样并返回新的GPUStats对象，
+                # 成功采样即为新数据，无需再与上次结果比较
+                stats = gpu_monitor.get_stats()
+                if stats:
+                    self._failures = 0
+                    self._last_stats = stats
+                    self._last_state = "ok"
+                    self.stats_updated.emit(stats)
                 else:
-                    self.stats_updated.emit(None)
-            except Exception as e:
-                logger.error(f"监控线程错误: {e}")
-            time.sleep(self.update_interval)
+                    self._failures += 1
+            elif self._last_state != "no-server":
+                # 无服务器状态只在首次进入时通知一次
+                self._last_state = "no-server"
+                self.stats_updated.emit(None)
+        except Exception as e:
+            self._failures += 1
+            self._last_state = "error"
+            logger.error(f"监控线程错误: {e}")
+        self._apply_interval()
     
     def stop(self):
         """停止线程"""
         self.running = False
+        self.quit()
 
 
 class GPUMonitorWidget(QGroupBox):
     """GPU监控组件"""
+    active_server_changed = pyqtSignal(object)  # 活动服务器配置变化信号
+
+    UI_UPDATE_RATE = 10  # 界面每秒最多刷新次数
+
+    # 状态颜色样式，只在init_ui中设置一次，控件通过state属性切换颜色
+    STATE_STYLESHEET = """
+    QLabel[state="ok"] { color: green; }
+    QLabel[state="warn"] { color: orange; }
+    QLabel[state="err"] { color: red; }
+    QProgressBar {
+        border: 1px solid #AAAAAA;
+        border-radius: 3px;
+        text-align: center;
+        background: #F0F0F0;
+    }
+    QProgressBar::chunk {
+        background-color: #66BB6A; /* 绿色 - 正常 */
+        border-radius: 2px;
+    }
+    QProgressBar[state="warn"]::chunk { background-color: #FFA726; /* 橙色 - 警告 */ }
+    QProgressBar[state="err"]::chunk { background-color: #FF5252; /* 红色 - 危险 */ }
+    """
 
     def __init__(self):
         super().__init__()
-        self.language_manager = LanguageManager()
-        self.monitor_thread = MonitorThread(update_interval=0.5)
+        self.language_manager = get_language_manager()
+        self._tr_cache = {}  # 翻译缓存，语言切换时清空
+        self.language_manager.language_changed.connect(self._clear_tr_cache)
+        self._idle_interval = config.get("gpu_monitor.update_interval", 2.0)
+        self._test_interval = config.get(
+            "gpu_monitor.test_update_interval", 1.0)
+        self.monitor_thread = MonitorThread(update_interval=self._idle_interval)
         self.monitor_thread.stats_updated.connect(self._on_stats_updated)
-        self.monitor_thread.server_config_needed.connect(
-            self._update_server_config)
+        self.active_server_changed.connect(
+            self.monitor_thread.set_active_server)
         self._monitor_initialized = False
+        self._servers = []  # 服务器列表缓存，只在refresh_servers中从数据库读取
+        self._active_server_id = None  # 数据库中当前激活的服务器ID
         self.current_gpu_index = 0  # 当前选中的GPU索引
         self.display_mode = "multi"  # 显示模式：默认为多GPU模式
         self.gpu_cards = []  # 存储GPU卡片组件
         
+        # 界面刷新节流：过快到达的数据先暂存，由定时器统一刷新
+        self._last_ui_update_ts = 0.0
+        self._pending_stats = None
+        self._hidden_update = False  # 隐藏期间是否收到过数据
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setSingleShot(True)
+        self._ui_flush_timer.timeout.connect(self._flush_pending_stats)
+        self._last_text = {}  # QLabel -> 最近一次写入的文本
+        self._widget_state = {}  # 控件 -> 当前state属性
+        self._last_values = {}  # 视图 -> 最近一次显示的取整数值
+        self._ui_state = None  # 当前显示的是监控界面("monitor")还是提示("hint")
+        
         # 自动连接设置
         self._auto_connect_first_server = True
         
@@ -110,6 +192,8 @@ class GPUMonitorWidget(QGroupBox):
     
     def init_ui(self):
         """初始化UI"""
+        self.setStyleSheet(self.STATE_STYLESHEET)
+
         main_layout = QVBoxLayout()
         main_layout.setSpacing(5)  # 减小组件间的间距
         main_layout.setContentsMargins(5, 5, 5, 5)  # 减小边距
@@ -188,8 +272,9 @@ class GPUMonitorWidget(QGroupBox):
         
         # 左侧 GPU 信息
         self.gpu_group = QGroupBox()
-        gpu_layout = QFormLayout()
+        gpu_layout = QGridLayout()
         gpu_layout.setSpacing(8)  # 增加行距
+        gpu_layout.setColumnStretch(1, 1)  # 数值列占用剩余宽度
         gpu_layout.setContentsMargins(8, 10, 8, 10)  # 增加内边距
 
         # 统一标签样式的函数
@@ -204,43 +289,50 @@ class GPUMonitorWidget(QGroupBox):
         setup_label_style(self.gpu_info_label)
         self.gpu_model_row = QLabel()
         setup_label_style(self.gpu_model_row)
-        gpu_layout.addRow(self.gpu_model_row, self.gpu_info_label)
+        gpu_layout.addWidget(self.gpu_model_row, 0, 0)
+        gpu_layout.addWidget(self.gpu_info_label, 0, 1)
         
         # GPU利用率
         self.gpu_util_label = QLabel("0%")
         setup_label_style(self.gpu_util_label)
         self.gpu_util_row = QLabel()
         setup_label_style(self.gpu_util_row)
-        gpu_layout.addRow(self.gpu_util_row, self.gpu_util_label)
+        gpu_layout.addWidget(self.gpu_util_row, 1, 0)
+        gpu_layout.addWidget(self.gpu_util_label, 1, 1)
         
         # 显存使用率
         self.memory_util_label = QLabel("0%")
         setup_label_style(self.memory_util_label)
         self.memory_util_row = QLabel()
         setup_label_style(self.memory_util_row)
-        gpu_layout.addRow(self.memory_util_row, self.memory_util_label)
+        gpu_layout.addWidget(self.memory_util_row, 2, 0)
+        gpu_layout.addWidget(self.memory_util_label, 2, 1)
         
         # 温度
         self.temp_label = QLabel("0°C")
         setup_label_style(self.temp_label)
         self.temp_row = QLabel()
         setup_label_style(self.temp_row)
-        gpu_layout.addRow(self.temp_row, self.temp_label)
+        gpu_layout.addWidget(self.temp_row, 3, 0)
+        gpu_layout.addWidget(self.temp_label, 3, 1)
         
         # 功率使用
         self.power_label = QLabel("0W")
         setup_label_style(self.power_label)
         self.power_row = QLabel()
         setup_label_style(self.power_row)
-        gpu_layout.addRow(self.power_row, self.power_label)
+        gpu_layout.addWidget(self.power_row, 4, 0)
+        gpu_layout.addWidget(self.power_label, 4, 1)
         
+        gpu_layout.setRowStretch(5, 1)  # 多余的高度留在底部，各行保持靠上
         self.gpu_group.setLayout(gpu_layout)
         info_layout.addWidget(self.gpu_group)
         
         # 右侧系统信息
         self.system_group = QGroupBox()
-        system_layout = QFormLayout()
+        system_layout = QGridLayout()
         system_layout.setSpacing(8)  # 保持与GPU信息相同的行距
+        system_layout.setColumnStretch(1, 1)  # 数值列占用剩余宽度
         system_layout.setContentsMargins(8, 10, 8, 10)  # 保持与GPU信息相同的内边距
         
         # CPU使用率
@@ -248,44 +340,49 @@ class GPUMonitorWidget(QGroupBox):
         setup_label_style(self.cpu_util_label)
         self.cpu_util_row = QLabel()
         setup_label_style(self.cpu_util_row)
-        system_layout.addRow(self.cpu_util_row, self.cpu_util_label)
+        system_layout.addWidget(self.cpu_util_row, 0, 0)
+        system_layout.addWidget(self.cpu_util_label, 0, 1)
         
         # 系统内存使用率
         self.memory_util_sys_label = QLabel("0%")
         setup_label_style(self.memory_util_sys_label)
         self.memory_util_sys_row = QLabel()
         setup_label_style(self.memory_util_sys_row)
-        system_layout.addRow(
-            self.memory_util_sys_row,
-            self.memory_util_sys_label)
+        system_layout.addWidget(self.memory_util_sys_row, 1, 0)
+        system_layout.addWidget(self.memory_util_sys_label, 1, 1)
         
         # 磁盘使用率
         self.disk_util_label = QLabel("0%")
         setup_label_style(self.disk_util_label)
         self.disk_util_row = QLabel()
         setup_label_style(self.disk_util_row)
-        system_layout.addRow(self.disk_util_row, self.disk_util_label)
+        system_layout.addWidget(self.disk_util_row, 2, 0)
+        system_layout.addWidget(self.disk_util_label, 2, 1)
 
         # 磁盘IO延时
         self.disk_io_label = QLabel("0ms")
         setup_label_style(self.disk_io_label)
         self.disk_io_row = QLabel()
         setup_label_style(self.disk_io_row)
-        system_layout.addRow(self.disk_io_row, self.disk_io_label)
+        system_layout.addWidget(self.disk_io_row, 3, 0)
+        system_layout.addWidget(self.disk_io_label, 3, 1)
         
         # 网络使用率
         self.network_recv_label = QLabel("0 B/s")
         setup_label_style(self.network_recv_label)
         self.network_recv_row = QLabel()
         setup_label_style(self.network_recv_row)
-        system_layout.addRow(self.network_recv_row, self.network_recv_label)
+        system_layout.addWidget(self.network_recv_row, 4, 0)
+        system_layout.addWidget(self.network_recv_label, 4, 1)
         
         self.network_send_label = QLabel("0 B/s")
         setup_label_style(self.network_send_label)
         self.network_send_row = QLabel()
         setup_label_style(self.network_send_row)
-        system_layout.addRow(self.network_send_row, self.network_send_label)
+        system_layout.addWidget(self.network_send_row, 5, 0)
+        system_layout.addWidget(self.network_send_label, 5, 1)
         
+        system_layout.setRowStretch(6, 1)  # 多余的高度留在底部，各行保持靠上
         self.system_group.setLayout(system_layout)
         info_layout.addWidget(self.system_group)
         
@@ -306,12 +403,9 @@ class GPUMonitorWidget(QGroupBox):
 
         # 系统信息（多GPU视图）
         self.system_group_multi = QGroupBox()
-        system_layout_multi = QFormLayout()
-        system_layout_multi.setSpacing(3)
-        system_layout_multi.setContentsMargins(5, 5, 5, 5)
-
         # 使用两列布局来节省空间
         sys_grid = QGridLayout()
+        sys_grid.setContentsMargins(5, 5, 5, 5)
         sys_grid.setHorizontalSpacing(15)  # 水平间距
         sys_grid.setVerticalSpacing(3)     # 垂直间距
 
@@ -345,8 +439,7 @@ class GPUMonitorWidget(QGroupBox):
         sys_grid.addWidget(QLabel(self.tr('network_send')), 2, 2)
         sys_grid.addWidget(self.network_send_label_multi, 2, 3)
 
-        system_layout_multi.addRow(sys_grid)
-        self.system_group_multi.setLayout(system_layout_multi)
+        self.system_group_multi.setLayout(sys_grid)
         multi_gpu_layout.addWidget(self.system_group_multi, 1)  # 1倍比例
 
         self.stacked_layout.addWidget(self.single_gpu_widget)
@@ -413,20 +506,31 @@ class GPUMonitorWidget(QGroupBox):
 
     def tr(self, key):
         """翻译文本"""
-        return self.language_manager.get_text(key)
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.language_manager.get_text(key)
+            self._tr_cache[key] = text
+        return text
+
+    def _clear_tr_cache(self, *_):
+        """清空翻译缓存"""
+        self._tr_cache.clear()
 
     def _update_server_config(self):
-        """响应监控线程的服务器配置请求"""
+        """查询活动服务器配置并推送给监控线程
+
+        只在服务器切换、刷新或添加时调用，监控线程不再轮询数据库。
+        """
         try:
             from src.data.db_manager import db_manager
             active_server = db_manager.get_active_gpu_server()
             if active_server and not self._monitor_initialized:  # 只在未初始化时初始化
                 gpu_monitor.init_monitor()
                 self._monitor_initialized = True
-            self.monitor_thread.set_active_server(active_server)
+            self.active_server_changed.emit(active_server)
         except Exception as e:
             logger.error(f"获取活动服务器配置失败: {e}")
-            self.monitor_thread.set_active_server(None)
+            self.active_server_changed.emit(None)
 
     def on_server_changed(self, index):
         """服务器改变处理"""
@@ -437,13 +541,14 @@ class GPUMonitorWidget(QGroupBox):
         server_id = self.server_selector.itemData(index)
         if server_id:
             try:
-                # 获取服务器名称然后设置为活跃
-                servers = db_manager.get_gpu_servers()
-                for server in servers:
-                    if server.get('id') == server_id:
-                        db_manager.set_gpu_server_active(
-                            server.get('name', ''))
-                        break
+                # 从缓存的服务器列表中取名称，只在切换到其他服务器时写数据库
+                if server_id != self._active_server_id:
+                    for server in self._servers:
+                        if server.get('id') == server_id:
+                            db_manager.set_gpu_server_active(
+                                server.get('name', ''))
+                            self._active_server_id = server_id
+                            break
 
                 self._monitor_initialized = False
                 self._update_server_config()
@@ -459,51 +564,64 @@ class GPUMonitorWidget(QGroupBox):
         """刷新服务器列表"""
         try:
             from src.data.db_manager import db_manager
-            self.server_selector.clear()
             servers = db_manager.get_gpu_servers()
+            self._servers = servers
             
             active_server = db_manager.get_active_gpu_server()
+            self._active_server_id = (
+                active_server.get('id') if active_server else None)
             active_index = -1
             found_server = False
 
-            for i, server in enumerate(servers):
-                # 安全地获取名称，如果alias不存在则使用name或host
-                display_name = server.get('host', '')
-                if 'name' in server:
-                    display_name = f"{display_name} ({server['name']})"
-                self.server_selector.addItem(display_name, server.get('id'))
-                if active_server and server.get(
-                        'id') == active_server.get('id'):
-                    active_index = i
-                    found_server = True
-
-            # 如果需要自动连接且有服务器可用
-            if self._auto_connect_first_server and servers:
-                if active_index >= 0:
-                    # 已有活动服务器，直接选择
+            # 填充和选中列表项期间屏蔽索引变化信号，否则每次clear/addItem
+            # 都会触发on_server_changed，反复写数据库并重新初始化监控；
+            # 需要连接服务器时在下面显式调用一次
+            connected = False
+            with QSignalBlocker(self.server_selector):
+                self.server_selector.clear()
+                for i, server in enumerate(servers):
+                    # 安全地获取名称，如果alias不存在则使用name或host
+                    display_name = server.get('host', '')
+                    if 'name' in server:
+                        display_name = f"{display_name} ({server['name']})"
+                    self.server_selector.addItem(display_name, server.get('id'))
+                    if server.get('id') == self._active_server_id:
+                        active_index = i
+                        found_server = True
+
+                # 如果需要自动连接且有服务器可用
+                if self._auto_connect_first_server and servers:
+                    if active_index >= 0:
+                        # 已有活动服务器，直接选择
+                        self.server_selector.setCurrentIndex(active_index)
+                        logger.info(f"自动连接到已配置的活动GPU服务器: {servers[active_index].get('name', servers[active_index].get('host', '未知'))}")
+                    else:
+                        # 没有活动服务器，选择第一个
+                        self.server_selector.setCurrentIndex(0)
+                        active_index = 0
+                        logger.info(f"自动连接到第一个可用的GPU服务器: {servers[0].get('name', servers[0].get('host', '未知'))}")
+                    
+                    # 标记为已自动连接，避免重复连接
+                    self._auto_connect_first_server = False
+                    
+                    # 触发连接事件
+                    if active_index >= 0:
+                        self.on_server_changed(active_index)
+                        connected = True
+                elif found_server:
+                    # 有活动服务器但不需要自动连接
                     self.server_selector.setCurrentIndex(active_index)
-                    logger.info(f"自动连接到已配置的活动GPU服务器: {servers[active_index].get('name', servers[active_index].get('host', '未知'))}")
-                else:
-                    # 没有活动服务器，选择第一个
+                elif servers and not found_server and not self._auto_connect_first_server:
+                    # 如果没有活动服务器但有服务器列表，且不需要自动连接，选择第一个但不连接
                     self.server_selector.setCurrentIndex(0)
-                    active_index = 0
-                    logger.info(f"自动连接到第一个可用的GPU服务器: {servers[0].get('name', servers[0].get('host', '未知'))}")
-                
-                # 标记为已自动连接，避免重复连接
-                self._auto_connect_first_server = False
-                
-                # 触发连接事件
-                if active_index >= 0:
-                    self.on_server_changed(active_index)
-            elif found_server:
-                # 有活动服务器但不需要自动连接
-                self.server_selector.setCurrentIndex(active_index)
-            elif servers and not found_server and not self._auto_connect_first_server:
-                # 如果没有活动服务器但有服务器列表，且不需要自动连接，选择第一个但不连接
-                self.server_selector.setCurrentIndex(0)
 
             if not servers:
                 self.show_no_servers_hint()
+            
+            # 服务器列表变化后同步活动服务器配置，并按最新配置重新初始化监控
+            if not connected:
+                self._monitor_initialized = False
+                self._update_server_config()
 
         except Exception as e:
             logger.error(f"刷新服务器列表失败: {e}")
@@ -532,15 +650,29 @@ class GPUMonitorWidget(QGroupBox):
     def show_no_servers_hint(self):
         """显示无服务器提示"""
         self.hint_label.setText(self.tr('no_servers_hint'))
-        self.stacked_layout.setVisible(False)
-        self.status_label.setVisible(False)
-        self.hint_label.setVisible(True)
+        if self._ui_state == "hint":
+            return
+        self._ui_state = "hint"
+        self.setUpdatesEnabled(False)
+        try:
+            self.stacked_layout.setVisible(False)
+            self.status_label.setVisible(False)
+            self.hint_label.setVisible(True)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def show_monitor_ui(self):
         """显示监控UI"""
-        self.hint_label.setVisible(False)
-        self.stacked_layout.setVisible(True)
-        self.status_label.setVisible(True)
+        if self._ui_state == "monitor":
+            return
+        self._ui_state = "monitor"
+        self.setUpdatesEnabled(False)
+        try:
+            self.hint_label.setVisible(False)
+            self.stacked_layout.setVisible(True)
+            self.status_label.setVisible(True)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_mode_changed(self, index):
         """显示模式改变处理"""
@@ -690,7 +822,7 @@ class GPUMonitorWidget(QGroupBox):
             card = self.gpu_cards[i]
             
             # 更新GPU信息
-            card['info_label'].setText(gpu['info'])
+            self._set_label_text(card['info_label'], gpu['info'])
 
             # 更新GPU利用率 - 使用进度条
             util = gpu['util']
@@ -706,13 +838,13 @@ class GPUMonitorWidget(QGroupBox):
 
             # 更新温度
             temp = gpu['temperature']
-            card['temp_value'].setText(f"{temp:.1f}°C")
+            self._set_label_text(card['temp_value'], f"{temp:.1f}°C")
             if temp >= 80:
-                card['temp_value'].setStyleSheet("color: red;")
+                self._set_state(card['temp_value'], "err")
             elif temp >= 70:
-                card['temp_value'].setStyleSheet("color: orange;")
+                self._set_state(card['temp_value'], "warn")
             else:
-                card['temp_value'].setStyleSheet("color: green;")
+                self._set_state(card['temp_value'], "ok")
 
             # 更新功率使用 - 使用进度条
             if gpu['power_limit'] > 0:
@@ -736,41 +868,33 @@ class GPUMonitorWidget(QGroupBox):
         for i in range(len(stats.gpus), len(self.gpu_cards)):
             self.gpu_cards[i]['widget'].setVisible(False)
 
+    def _set_label_text(self, label, text):
+        """设置标签文本，文本未变化时跳过，避免无谓的重新布局和重绘"""
+        if self._last_text.get(label) != text:
+            label.setText(text)
+            self._last_text[label] = text
+
     def _set_progress_bar_color(self, progress_bar, value):
         """设置进度条颜色"""
-        base_style = """
-        QProgressBar {
-            border: 1px solid #AAAAAA;
-            border-radius: 3px;
-            text-align: center;
-            background: #F0F0F0;
-        }
-        """
-        
         if value >= 90:
-            style = base_style + """
-            QProgressBar::chunk {
-                background-color: #FF5252; /* 红色 - 危险 */
-                border-radius: 2px;
-            }
-            """
-            progress_bar.setStyleSheet(style)
+            self._set_state(progress_bar, "err")  # 红色 - 危险
         elif value >= 70:
-            style = base_style + """
-            QProgressBar::chunk {
-                background-color: #FFA726; /* 橙色 - 警告 */
-                border-radius: 2px;
-            }
-            """
-            progress_bar.setStyleSheet(style)
+            self._set_state(progress_bar, "warn")  # 橙色 - 警告
         else:
-            style = base_style + """
-            QProgressBar::chunk {
-                background-color: #66BB6A; /* 绿色 - 正常 */
-                border-radius: 2px;
-            }
-            """
-            progress_bar.setStyleSheet(style)
+            self._set_state(progress_bar, "ok")  # 绿色 - 正常
+
+    def _set_state(self, widget, state):
+        """切换控件的state属性，由STATE_STYLESHEET决定颜色
+
+        只在状态变化时重新polish，避免每次刷新都重新解析样式表
+        """
+        if self._widget_state.get(widget) == state:
+            return
+        self._widget_state[widget] = state
+        widget.setProperty("state", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _update_single_gpu_view(self):
         """更新单GPU视图"""
@@ -781,38 +905,70 @@ class GPUMonitorWidget(QGroupBox):
         
         gpu = stats.gpus[self.current_gpu_index]
 
+        # 按显示精度取整后与上次比较，数值未变化时跳过格式化和设置文本
+        key = (self.current_gpu_index, gpu['info'], round(gpu['util'], 1),
+               round(gpu['memory_used'], 1), round(gpu['memory_total'], 1),
+               round(gpu['temperature'], 1), round(gpu['power_usage'], 1),
+               round(gpu['power_limit'], 1))
+        if self._last_values.get('single_gpu') == key:
+            return
+        self._last_values['single_gpu'] = key
+
         # 更新GPU信息
-        self.gpu_info_label.setText(gpu['info'])
+        self._set_label_text(self.gpu_info_label, gpu['info'])
             
         # 更新GPU利用率
         util = gpu['util']
-        self.gpu_util_label.setText(f"{util:.1f}%")
+        self._set_label_text(self.gpu_util_label, f"{util:.1f}%")
             
         # 更新显存使用率
         memory_util = (gpu['memory_used'] / gpu['memory_total']
                     ) * 100 if gpu['memory_total'] > 0 else 0
-        self.memory_util_label.setText(
-            f"{memory_util:.1f}% ({self._format_size(gpu['memory_used'])}/{self._format_size(gpu['memory_total'])})"
-            )
+        memory_used_s = self._format_size(gpu['memory_used'])
+        memory_total_s = self._format_size(gpu['memory_total'])
+        self._set_label_text(
+            self.memory_util_label,
+            f"{memory_util:.1f}% ({memory_used_s}/{memory_total_s})")
             
         # 更新温度
         temp = gpu['temperature']
-        self.temp_label.setText(f"{temp:.1f}°C")
+        self._set_label_text(self.temp_label, f"{temp:.1f}°C")
             
         # 更新功率使用
         if gpu['power_limit'] > 0:
-            self.power_label.setText(
-                "{:.1f}W/{:.1f}W ({:.1f}%)".format(
-                    gpu['power_usage'],
-                    gpu['power_limit'],
-                    (gpu['power_usage'] / gpu['power_limit']) * 100
-                )
+            power_text = "{:.1f}W/{:.1f}W ({:.1f}%)".format(
+                gpu['power_usage'],
+                gpu['power_limit'],
+                (gpu['power_usage'] / gpu['power_limit']) * 100
             )
         else:
-            self.power_label.setText("{:.1f}W".format(gpu['power_usage']))
+            power_text = "{:.1f}W".format(gpu['power_usage'])
+        self._set_label_text(self.power_label, power_text)
 
     def _on_stats_updated(self, stats):
-        """处理监控数据更新"""
+        """处理监控数据更新，按 UI_UPDATE_RATE 节流"""
+        if not self.isVisible():
+            # 不可见时只保留最新数据，等显示时再刷新
+            self._pending_stats = stats
+            self._hidden_update = True
+            return
+        now = time.monotonic()
+        wait = 1.0 / self.UI_UPDATE_RATE - (now - self._last_ui_update_ts)
+        if wait > 0:
+            self._pending_stats = stats
+            if not self._ui_flush_timer.isActive():
+                self._ui_flush_timer.start(int(wait * 1000) + 1)
+            return
+        self._last_ui_update_ts = now
+        self._apply_stats(stats)
+
+    def _flush_pending_stats(self):
+        """刷新暂存的监控数据"""
+        stats, self._pending_stats = self._pending_stats, None
+        self._on_stats_updated(stats)
+
+    def _apply_stats(self, stats):
+        """将监控数据应用到界面"""
         if not stats:
             self.show_no_servers_hint()
             return
@@ -842,46 +998,58 @@ class GPUMonitorWidget(QGroupBox):
             # 更新系统信息（同时更新单GPU和多GPU模式下的系统信息）
             self._update_system_info(stats)
 
-            self.status_label.setText(self.tr('status_normal'))
-            self.status_label.setStyleSheet("color: green")
+            self._set_label_text(self.status_label, self.tr('status_normal'))
+            self._set_state(self.status_label, "ok")
             
             # 显示监控UI
             self.show_monitor_ui()
             
         except Exception as e:
             logger.error(f"更新UI失败: {e}")
-            self.status_label.setText(f"{self.tr('status_error')} - {str(e)}")
-            self.status_label.setStyleSheet("color: red")
+            self._set_label_text(
+                self.status_label, f"{self.tr('status_error')} - {str(e)}")
+            self._set_state(self.status_label, "err")
 
     def _update_system_info(self, stats):
         """更新系统信息"""
-        # 单GPU模式下的系统信息
-        self.cpu_util_label.setText(f"{stats.cpu_util:.1f}%")
-        self.memory_util_sys_label.setText(f"{stats.memory_util:.1f}%")
-        self.disk_util_label.setText(f"{stats.disk_util:.1f}%")
-        self.disk_io_label.setText(f"{stats.disk_io_latency:.1f}ms")
-            
+        # 按显示精度取整后与上次比较，数值未变化时跳过格式化和设置文本
+        net = stats.network_io
+        key = (round(stats.cpu_util, 1), round(stats.memory_util, 1),
+               round(stats.disk_util, 1), round(stats.disk_io_latency, 1),
+               round(net.get('receive_rate', 0.1), 4) if net else None,
+               round(net.get('send_rate', 0.1), 4) if net else None)
+        if self._last_values.get('system') == key:
+            return
+        self._last_values['system'] = key
+
+        set_text = self._set_label_text
+        cpu_text = f"{stats.cpu_util:.1f}%"
+        memory_text = f"{stats.memory_util:.1f}%"
+        disk_text = f"{stats.disk_util:.1f}%"
+        disk_io_text = f"{stats.disk_io_latency:.1f}ms"
         if stats.network_io:
             recv_speed = stats.network_io.get('receive_rate', 0.1)  # 默认至少0.1KB/s
             send_speed = stats.network_io.get('send_rate', 0.1)  # 默认至少0.1KB/s
-            self.network_recv_label.setText(self._format_network_speed(recv_speed))
-            self.network_send_label.setText(self._format_network_speed(send_speed))
+            recv_text = self._format_network_speed(recv_speed)
+            send_text = self._format_network_speed(send_speed)
         else:
-            self.network_recv_label.setText("N/A")
-            self.network_send_label.setText("N/A")
+            recv_text = send_text = "N/A"
+
+        # 单GPU模式下的系统信息
+        set_text(self.cpu_util_label, cpu_text)
+        set_text(self.memory_util_sys_label, memory_text)
+        set_text(self.disk_util_label, disk_text)
+        set_text(self.disk_io_label, disk_io_text)
+        set_text(self.network_recv_label, recv_text)
+        set_text(self.network_send_label, send_text)
             
         # 多GPU模式下的系统信息
-        self.cpu_util_label_multi.setText(f"{stats.cpu_util:.1f}%")
-        self.memory_util_label_multi.setText(f"{stats.memory_util:.1f}%")
-        self.disk_util_label_multi.setText(f"{stats.disk_util:.1f}%")
-        self.disk_io_label_multi.setText(f"{stats.disk_io_latency:.1f}ms")
-
-        if stats.network_io:
-            self.network_recv_label_multi.setText(self._format_network_speed(recv_speed))
-            self.network_send_label_multi.setText(self._format_network_speed(send_speed))
-        else:
-            self.network_recv_label_multi.setText("N/A")
-            self.network_send_label_multi.setText("N/A")
+        set_text(self.cpu_util_label_multi, cpu_text)
+        set_text(self.memory_util_label_multi, memory_text)
+        set_text(self.disk_util_label_multi, disk_text)
+        set_text(self.disk_io_label_multi, disk_io_text)
+        set_text(self.network_recv_label_multi, recv_text)
+        set_text(self.network_send_label_multi, send_text)
 
     def _format_size(self, size_mb):
         """格式化显存大小显示"""
@@ -908,6 +1076,34 @@ class GPUMonitorWidget(QGroupBox):
         if not self.monitor_thread.isRunning():
             self.monitor_thread.start()
 
+    def set_test_running(self, running):
+        """测试运行期间加快轮询，测试结束后恢复默认间隔"""
+        self.monitor_thread.set_update_interval(
+            min(self._test_interval, self._idle_interval)
+            if running else self._idle_interval)
+
+    def showEvent(self, event):
+        """组件显示时恢复监控，并刷新隐藏期间收到的最新数据"""
+        super().showEvent(event)
+        self.resume_monitoring()
+        if self._hidden_update:
+            self._hidden_update = False
+            if not self._ui_flush_timer.isActive():
+                self._flush_pending_stats()
+
+    def hideEvent(self, event):
+        """组件隐藏时（如切换到其他标签页）暂停监控，避免后台轮询"""
+        self.pause_monitoring()
+        super().hideEvent(event)
+
+    def pause_monitoring(self):
+        """暂停数据采集（不阻塞界面线程）"""
+        self.monitor_thread.paused = True
+
+    def resume_monitoring(self):
+        """恢复数据采集"""
+        self.monitor_thread.paused = False
+
     def stop_monitoring(self):
         """停止监控"""
         if self.monitor_thread.isRunning():
@@ -5,8 +5,7 @@ import time
 import logging
 from typing import Dict, List, Callable
 from PyQt6.QtCore import QObject, pyqtSignal
-from src.engine.test_manager import TestTask, TestProgress
-from src.engine.api_client import APIResponse
+from src.engine.test_manager import TestManager, TestTask, TestProgress
 from src.gui.widgets.test_thread import TestThread
 
 # 设置日志记录器
@@ -18,7 +17,7 @@ class TestExecutor(QObject):
     
     # 定义信号
     progress_updated = pyqtSignal(TestProgress)
-    result_received = pyqtSignal(str, APIResponse)
+    results_received = pyqtSignal(list)  # [(dataset_name, APIResponse), ...]
     test_finished = pyqtSignal()
     test_error = pyqtSignal(str)
     
@@ -35,9 +34,11 @@ class TestExecutor(QObject):
             tasks: List[TestTask],
             test_task_id: str,
             on_progress_updated: Callable = None,
-            on_result_received: Callable = None,
+            on_results_received: Callable = None,
             on_test_finished: Callable = None,
-            on_test_error: Callable = None):
+            on_test_error: Callable = None,
+            test_manager: TestManager = None,
+            model_config: dict = None):
         """开始测试
         
         Args:
@@ -45,9 +46,11 @@ class TestExecutor(QObject):
             tasks: 测试任务列表
             test_task_id: 测试任务ID
             on_progress_updated: 进度更新回调
-            on_result_received: 结果接收回调
+            on_results_received: 批量结果接收回调
             on_test_finished: 测试完成回调
             on_test_error: 测试错误回调
+            test_manager: 复用的测试管理器，为空时由测试线程自行创建
+            model_config: 模型配置，为空时由测试线程按模型名称查询
         """
         try:
             # 检查是否已经在运行
@@ -59,14 +62,16 @@ class TestExecutor(QObject):
             self.test_thread = TestThread(
                 model_name,
                 tasks,
-                test_task_id
+                test_task_id,
+                test_manager=test_manager,
+                model_config=model_config
             )
             
             # 连接信号
             if on_progress_updated:
                 self.test_thread.progress_updated.connect(on_progress_updated)
-            if on_result_received:
-                self.test_thread.result_received.connect(on_result_received)
+            if on_results_received:
+                self.test_thread.results_received.connect(on_results_received)
             if on_test_finished:
                 self.test_thread.test_finished.connect(on_test_finished)
             if on_test_error:
@@ -74,7 +79,7 @@ class TestExecutor(QObject):
             
             # 连接内部信号
             self.test_thread.progress_updated.connect(self.progress_updated)
-            self.test_thread.result_received.connect(self.result_received)
+            self.test_thread.results_received.connect(self.results_received)
             self.test_thread.test_finished.connect(self._on_test_finished)
             self.test_thread.test_error.connect(self._on_test_error)
             
@@ -107,6 +112,8 @@ class TestExecutor(QObject):
             if self.test_thread.isRunning():
                 self.test_thread.terminate()  # 强制终止线程
                 self.test_thread.wait(1000)  # 等待最多1秒
+            # 强制终止时run()的finally不会执行，这里补做断开
+            self.test_thread.release_test_manager()
             
             self.is_running = False
             logger.info("测试已停止")
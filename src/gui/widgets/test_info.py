@@ -5,12 +5,13 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QGroupBox,
-    QTextEdit,
+    QPlainTextEdit,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView
 )
-from src.gui.i18n.language_manager import LanguageManager
+from src.gui.i18n.language_manager import get_language_manager
+from src.gui.widgets.test_records_manager import DatasetStats
 from src.utils.logger import setup_logger
 
 # 设置日志记录器
@@ -20,9 +21,14 @@ logger = setup_logger("test_info")
 class TestInfoWidget(QWidget):
     """实时测试信息显示组件"""
 
+    MAX_ERROR_LINES = 500  # 错误信息框最多保留的行数
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.language_manager = LanguageManager()
+        self.language_manager = get_language_manager()
+        self._tr_cache = {}  # 翻译缓存，语言切换时清空
+        self.language_manager.language_changed.connect(self._clear_tr_cache)
+        self._row_items = {}  # 数据集名称 -> 该行的 QTableWidgetItem 列表
         self.init_ui()
         self.update_ui_text()
         
@@ -51,7 +57,15 @@ class TestInfoWidget(QWidget):
     
     def tr(self, key):
         """翻译文本"""
-        return self.language_manager.get_text(key)
+        text = self._tr_cache.get(key)
+        if text is None:
+            text = self.language_manager.get_text(key)
+            self._tr_cache[key] = text
+        return text
+
+    def _clear_tr_cache(self, *_):
+        """清空翻译缓存"""
+        self._tr_cache.clear()
         
     def init_ui(self):
         layout = QVBoxLayout()
@@ -66,13 +80,14 @@ class TestInfoWidget(QWidget):
         
         # 设置表格属性
         header = self.info_table.horizontalHeader()
-        # 设置所有列先自适应内容
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # 数据列使用固定初始宽度（可手动拖动调整），不使用ResizeToContents，
+        # 否则每次更新单元格都要遍历所有行重新计算列宽
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
         # 设置特定列的宽度策略
         header.setSectionResizeMode(
             0, QHeaderView.ResizeMode.Stretch)  # 数据集名称列自适应剩余空间
-        # 为其他列设置最小宽度，确保数据显示完整
+        # 为其他列设置宽度，确保数据显示完整
         min_widths = {
             1: 100,  # 完成/总数
             2: 80,   # 成功率
@@ -92,8 +107,10 @@ class TestInfoWidget(QWidget):
         self.error_group = QGroupBox(self.tr('error'))
         error_layout = QVBoxLayout()
         
-        self.error_text = QTextEdit()
+        # 纯文本追加，并限制保留的行数，避免高错误率时内容无限增长
+        self.error_text = QPlainTextEdit()
         self.error_text.setReadOnly(True)
+        self.error_text.setMaximumBlockCount(self.MAX_ERROR_LINES)
         self.error_text.setMaximumHeight(60)  # 减小高度
         self.error_text.setPlaceholderText(self.tr('error_info_placeholder'))
         error_layout.addWidget(self.error_text)
@@ -106,62 +123,57 @@ class TestInfoWidget(QWidget):
         layout.setSpacing(10)  # 增加组件之间的间距
         self.setLayout(layout)
     
-    def update_dataset_info(self, dataset_name: str, stats: dict):
+    def update_dataset_info(self, dataset_name: str, stats: DatasetStats):
         """更新数据集测试信息"""
-        # 查找数据集行
-        found = False
-        for row in range(self.info_table.rowCount()):
-            if self.info_table.item(row, 0).text() == dataset_name:
-                found = True
-                break
-        
-        # 如果没找到，添加新行
-        if not found:
+        # 查找数据集行对应的单元格，首次出现时添加新行并创建单元格
+        items = self._row_items.get(dataset_name)
+        if items is None:
             row = self.info_table.rowCount()
             self.info_table.insertRow(row)
-            self.info_table.setItem(row, 0, QTableWidgetItem(dataset_name))
+            items = [QTableWidgetItem()
+                     for _ in range(self.info_table.columnCount())]
+            items[0].setText(dataset_name)
+            for col, item in enumerate(items):
+                self.info_table.setItem(row, col, item)
+            self._row_items[dataset_name] = items
         
         # 更新统计信息
-        completion = f"{stats['successful']}/{stats['total']}"
-        self.info_table.setItem(row, 1, QTableWidgetItem(completion))
-        
-        success_rate = (
-            stats['successful'] /
-            stats['total'] *
-            100) if stats['total'] > 0 else 0
-        self.info_table.setItem(
-            row, 2, QTableWidgetItem(f"{success_rate:.1f}%"))
+        successful = stats.successful
+        total = stats.total
+        completion = f"{successful}/{total}"
+        
+        success_rate = successful * 100 / total if total > 0 else 0
 
-        # 使用安全的方式计算平均响应时间，避免除零错误
-        # 优先使用stats中提供的avg_response_time
-        avg_time = stats.get('avg_response_time', 0)
-        if avg_time == 0 and stats['successful'] > 0:
-            # 如果未提供，则计算，但避免除零
-            avg_time = stats['total_time'] / stats['successful'] if stats['successful'] > 0 else 0
-        self.info_table.setItem(row, 3, QTableWidgetItem(f"{avg_time:.1f}s"))
+        # 优先使用stats中提供的avg_response_time，未提供时再计算
+        avg_time = stats.avg_response_time
+        if avg_time == 0 and successful > 0:
+            avg_time = stats.total_time / successful
         
         # 使用stats中提供的avg_generation_speed值，而不是自行计算
         # 这样可以确保考虑了并发数的计算结果
-        avg_speed = stats.get('avg_generation_speed', 0)
-        self.info_table.setItem(
-            row, 4, QTableWidgetItem(f"{avg_speed:.1f}字/秒"))
-        
-        current_speed = stats.get('current_speed', 0)
-        self.info_table.setItem(
-            row, 5, QTableWidgetItem(f"{current_speed:.1f}字/秒"))
-        
-        self.info_table.setItem(
-            row, 6, QTableWidgetItem(str(stats['total_chars'])))
-        
-        # 获取平均TPS值，如果不存在则使用0
-        avg_tps = stats.get('avg_tps', 0)
-        self.info_table.setItem(row, 7, QTableWidgetItem(f"{avg_tps:.1f}"))
+        avg_speed = stats.avg_generation_speed
+        current_speed = stats.current_speed
+        avg_tps = stats.avg_tps
+        
+        # 原地更新已有单元格，合并为一次重绘
+        self.info_table.setUpdatesEnabled(False)
+        try:
+            items[1].setText(completion)
+            items[2].setText(f"{success_rate:.1f}%")
+            items[3].setText(f"{avg_time:.1f}s")
+            items[4].setText(f"{avg_speed:.1f}字/秒")
+            items[5].setText(f"{current_speed:.1f}字/秒")
+            items[6].setText(str(stats.total_chars))
+            items[7].setText(f"{avg_tps:.1f}")
+        finally:
+            self.info_table.setUpdatesEnabled(True)
     
     def add_error(self, error_msg: str):
         """添加错误信息"""
-        self.error_text.append(error_msg)
+        self.error_text.appendPlainText(error_msg)
     
     def clear(self):
         """清空所有信息"""
         self.info_table.setRowCount(0)
+        self._row_items.clear()
         self.error_text.clear() 
\ No newline at end of file
@@ -2,13 +2,14 @@
 测试进度显示组件模块
 """
 from PyQt6.QtWidgets import (
+    QWidget,
     QGroupBox,
     QVBoxLayout,
+    QGridLayout,
     QLabel,
-    QProgressBar,
-    QTextEdit
+    QProgressBar
 )
-from src.gui.i18n.language_manager import LanguageManager
+from src.gui.i18n.language_manager import get_language_manager
 from src.utils.logger import setup_logger
 
 # 设置日志记录器
@@ -18,9 +19,21 @@ logger = setup_logger("test_progress")
 class TestProgressWidget(QGroupBox):
     """测试进度显示组件"""
 
+    # 详细信息字段（翻译键），按显示顺序排列
+    DETAIL_KEYS = (
+        'test_task_id',
+        'completed',
+        'success_rate',
+        'avg_response_time',
+        'avg_generation_speed',
+        'current_speed',
+        'avg_tps',
+        'last_error'
+    )
+
     def __init__(self):
         super().__init__()
-        self.language_manager = LanguageManager()
+        self.language_manager = get_language_manager()
         self.setObjectName("test_progress_widget")
         self.init_ui()
         self.update_ui_text()
@@ -31,6 +44,9 @@ class TestProgressWidget(QGroupBox):
     def update_ui_text(self):
         """更新UI文本"""
         self.setTitle(self.tr('test_progress'))
+        self.placeholder_label.setText(self.tr('test_progress_placeholder'))
+        for key, name_label in self._detail_names.items():
+            name_label.setText(self.tr(key) + ":")
     
     def tr(self, key):
         """翻译文本"""
@@ -51,12 +67,53 @@ class TestProgressWidget(QGroupBox):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
         
-        # 添加详细信息文本框
-        self.detail_text = QTextEdit()
-        self.detail_text.setReadOnly(True)
-        self.detail_text.setMaximumHeight(60)  # 减小高度
-        self.detail_text.setPlaceholderText(
-            self.tr('test_progress_placeholder'))
-        layout.addWidget(self.detail_text)
+        # 添加详细信息占位提示
+        self.placeholder_label = QLabel(self.tr('test_progress_placeholder'))
+        self.placeholder_label.setStyleSheet("color: #666666;")
+        layout.addWidget(self.placeholder_label)
+        
+        # 添加详细信息区域，每个字段一对标签，只更新数值变化的标签
+        self.detail_widget = QWidget()
+        detail_layout = QGridLayout(self.detail_widget)
+        detail_layout.setContentsMargins(0, 0, 0, 0)
+        detail_layout.setVerticalSpacing(2)
+        self._detail_names = {}
+        self._detail_values = {}
+        self._detail_texts = {}  # 最近一次写入的数值文本
+        for i, key in enumerate(self.DETAIL_KEYS):
+            name_label = QLabel(self.tr(key) + ":")
+            value_label = QLabel()
+            if key == 'last_error':
+                # 错误信息可能较长，单独占一整行
+                row = (len(self.DETAIL_KEYS) + 1) // 2
+                value_label.setWordWrap(True)
+                detail_layout.addWidget(name_label, row, 0)
+                detail_layout.addWidget(value_label, row, 1, 1, 3)
+            else:
+                row, col = divmod(i, 2)
+                detail_layout.addWidget(name_label, row, col * 2)
+                detail_layout.addWidget(value_label, row, col * 2 + 1)
+            self._detail_names[key] = name_label
+            self._detail_values[key] = value_label
+        self.detail_widget.setVisible(False)
+        layout.addWidget(self.detail_widget)
         
-        self.setLayout(layout) 
\ No newline at end of file
+        self.setLayout(layout)
+    
+    def set_detail(self, key: str, text: str):
+        """更新单个详细信息字段，数值未变化时不触发重绘"""
+        if self._detail_texts.get(key) == text:
+            return
+        self._detail_texts[key] = text
+        self._detail_values[key].setText(text)
+        if self.detail_widget.isHidden():
+            self.placeholder_label.setVisible(False)
+            self.detail_widget.setVisible(True)
+    
+    def clear_details(self):
+        """清空详细信息并显示占位提示"""
+        for label in self._detail_values.values():
+            label.clear()
+        self._detail_texts.clear()
+        self.detail_widget.setVisible(False)
+        self.placeholder_label.setVisible(True) 
\ No newline at end of file
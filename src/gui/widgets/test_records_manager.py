@@ -4,11 +4,88 @@
 import os
 import time
 import logging
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
 # 设置日志记录器
 logger = logging.getLogger("test_records_manager")
 
+# 测试期间不会变化的字段，每个测试只需同步一次
+_STABLE_SYNC_KEYS = frozenset({
+    "test_task_id",
+    "session_name",
+    "model_name",
+    "model_config",
+    "concurrency",
+    "total_tasks",
+    "start_time",
+})
+
+# 测试期间持续变化的字段，每次同步都需要更新；
+# datasets 直接共享同一个字典引用，不做复制
+_DYNAMIC_SYNC_KEYS = (
+    "successful_tasks",
+    "failed_tasks",
+    "total_tokens",
+    "total_chars",
+    "total_time",
+    "datasets",
+    "status",
+    "avg_response_time",
+    "avg_generation_speed",
+    "current_speed",
+    "avg_tps",
+)
+
+
+@dataclass(slots=True)
+class DatasetStats:
+    """单个数据集的实时统计数据"""
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_time: float = 0.0
+    total_tokens: int = 0
+    total_chars: int = 0
+    avg_response_time: float = 0.0
+    avg_generation_speed: float = 0.0
+    current_speed: float = 0.0
+    avg_tps: float = 0.0
+    weight: int = 1
+    concurrency: int = 1
+    start_time: float = 0.0  # time.monotonic() 时钟
+
+
+def apportion_concurrency(weights: Dict[str, int], total: int) -> Dict[str, int]:
+    """按权重把总并发数分配给各数据集（最大余数法）
+
+    先按比例向下取整，剩余的并发数按小数部分从大到小依次补给各数据集，
+    使分配结果之和等于总并发数；每个数据集至少分配1个并发。
+
+    Args:
+        weights: 数据集权重，格式为 {dataset_name: weight}
+        total: 总并发数
+
+    Returns:
+        Dict[str, int]: 各数据集的并发数
+    """
+    total_weight = sum(weights.values())
+    if total_weight <= 0:
+        return {name: 1 for name in weights}
+
+    inv = total / total_weight  # 每单位权重分到的并发数
+    quotas = {name: weight * inv for name, weight in weights.items()}
+    result = {name: int(quota) for name, quota in quotas.items()}
+
+    remaining = total - sum(result.values())
+    if remaining > 0:
+        by_remainder = sorted(
+            quotas, key=lambda name: quotas[name] - result[name], reverse=True)
+        for name in by_remainder[:remaining]:
+            result[name] += 1
+
+    return {name: max(1, count) for name, count in result.items()}
+
 
 class TestRecordsManager:
     """测试记录管理类"""
@@ -16,6 +93,12 @@ class TestRecordsManager:
     def __init__(self):
         """初始化测试记录管理器"""
         self.current_test_records = None
+        self._records_version = 0  # 记录每次变化时递增
+        self._synced_version = -1  # 最近一次同步时的记录版本
+    
+    def mark_changed(self):
+        """标记当前测试记录已变化，下次同步时需要重新保存"""
+        self._records_version += 1
     
     def init_test_records(
             self,
@@ -50,6 +133,7 @@ class TestRecordsManager:
                 "concurrency": total_concurrency,
                 "datasets": {},
                 "start_time": time.time(),
+                "start_monotonic": time.monotonic(),  # 用于计算耗时，不受系统时间调整影响
                 "successful_tasks": 0,
                 "failed_tasks": 0,
                 "total_tokens": 0,
@@ -66,32 +150,28 @@ class TestRecordsManager:
                     "tests",
                     f"{test_task_id}.log")}
             
+            # 按权重分配各数据集的并发数
+            concurrency_map = apportion_concurrency(
+                {name: weight for name, (_, weight) in selected_datasets.items()},
+                total_concurrency)
+            
             # 初始化每个数据集的统计信息
             total_tasks = 0  # 重置总任务数
+            start_time = time.monotonic()
             for dataset_name, (prompts, weight) in selected_datasets.items():
-                # 计算每个数据集的实际并发数
-                dataset_concurrency = max(
-                    1, int((weight / total_weight) * total_concurrency))
+                dataset_concurrency = concurrency_map[dataset_name]
                 # 使用并发数作为该数据集的任务数
                 dataset_tasks = dataset_concurrency
                 total_tasks += dataset_tasks
                 
                 logger.info(
                     f"数据集 {dataset_name} 配置: 权重={weight}, 并发数={dataset_concurrency}, 任务数={dataset_tasks}")
-                records["datasets"][dataset_name] = {
-                    "total": dataset_tasks,  # 使用并发数作为任务数
-                    "successful": 0,
-                    "failed": 0,
-                    "total_time": 0.0,
-                    "total_tokens": 0,
-                    "total_chars": 0,
-                    "avg_response_time": 0.0,
-                    "avg_generation_speed": 0.0,
-                    "current_speed": 0.0,
-                    "weight": weight,
-                    "concurrency": dataset_concurrency,
-                    "start_time": time.time()
-                }
+                records["datasets"][dataset_name] = DatasetStats(
+                    total=dataset_tasks,  # 使用并发数作为任务数
+                    weight=weight,
+                    concurrency=dataset_concurrency,
+                    start_time=start_time
+                )
             
             # 设置总任务数为所有数据集的并发数之和
             records["total_tasks"] = total_tasks
@@ -99,10 +179,14 @@ class TestRecordsManager:
             
             # 保存到本地缓存
             self.current_test_records = records
+            self._records_version = 0
+            self._synced_version = -1
             
             return records
         except Exception as e:
-            logger.error(f"初始化测试记录时出错: {e}", exc_info=True)
+            logger.error(
+                "初始化测试记录时出错: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG))
             raise
     
     def sync_test_records(self, results_tab=None):
@@ -115,9 +199,15 @@ class TestRecordsManager:
             if not self.current_test_records:
                 logger.warning("没有当前测试记录，无法同步")
                 return
+            
+            # 自上次同步后记录没有变化，无需重复保存
+            if self._records_version == self._synced_version:
+                logger.debug("测试记录无变化，跳过同步")
+                return
                 
             # 更新结束时间
-            if self.current_test_records["status"] in ["completed", "error"]:
+            finished = self.current_test_records["status"] in ("completed", "error")
+            if finished:
                 self.current_test_records["end_time"] = time.time()
             
             # 同步到 results_tab
@@ -128,38 +218,33 @@ class TestRecordsManager:
                         'current_records') or not results_tab.current_records:
                     results_tab.current_records = self.current_test_records.copy()
                 else:
-                    # 更新关键字段
-                    for key in [
-                        "test_task_id",
-                        "session_name",
-                        "model_name",
-                        "model_config",
-                        "concurrency",
-                        "total_tasks",
-                        "successful_tasks",
-                        "failed_tasks",
-                        "total_tokens",
-                        "total_chars",
-                        "total_time",
-                        "datasets",
-                        "status",
-                        "avg_response_time",
-                        "avg_generation_speed",
-                        "current_speed",
-                        "avg_tps",
-                        "start_time",
-                            "end_time"]:
-                        if key in self.current_test_records:
-                            results_tab.current_records[key] = self.current_test_records[key]
+                    # 更新关键字段，固定字段只在切换到新测试时同步一次
+                    records = self.current_test_records
+                    target = results_tab.current_records
+                    if target.get("test_task_id") != records["test_task_id"]:
+                        target.update(
+                            (key, records[key])
+                            for key in _STABLE_SYNC_KEYS & records.keys())
+                        target.pop("end_time", None)  # 上一个测试的结束时间
+                    target.update(
+                        (key, records[key])
+                        for key in _DYNAMIC_SYNC_KEYS if key in records)
+                    if finished:
+                        target["end_time"] = records["end_time"]
                 
-                # 保存记录
-                results_tab._save_test_records()
+                # 测试结束后才写入日志汇总和数据库；运行中只同步内存中的记录，
+                # 中途保存的记录成功数与失败数之和不等于总任务数，数据库也会拒绝
+                if finished:
+                    results_tab._save_test_records()
+                self._synced_version = self._records_version
                 logger.debug("测试记录已同步到 results_tab")
             else:
                 logger.warning("未提供 results_tab，无法保存测试记录")
                 
         except Exception as e:
-            logger.error(f"同步测试记录时出错: {e}", exc_info=True)
+            logger.error(
+                "同步测试记录时出错: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG))
     
     def clear_test_state(self):
         """清空测试状态"""
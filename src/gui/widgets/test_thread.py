@@ -2,8 +2,9 @@
 测试线程模块
 """
 import asyncio
+import time
 from typing import List
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from src.engine.test_manager import TestManager, TestTask, TestProgress
 from src.engine.api_client import APIResponse
 from src.data.db_manager import db_manager
@@ -16,32 +17,48 @@ logger = setup_logger("test_thread")
 class TestThread(QThread):
     """测试线程"""
     progress_updated = pyqtSignal(TestProgress)
-    result_received = pyqtSignal(str, APIResponse)
+    results_received = pyqtSignal(list)  # [(dataset_name, APIResponse), ...]
     test_finished = pyqtSignal()
     test_error = pyqtSignal(str)
     
+    # 进度信号的最小发送间隔（秒），避免高并发时跨线程信号队列堆积
+    PROGRESS_EMIT_INTERVAL = 0.1
+    # 结果信号的最小发送间隔（秒），期间的结果合并为一批发送
+    RESULT_EMIT_INTERVAL = 0.05
+    
     def __init__(
             self,
             model_name: str,
             tasks: List[TestTask],
-            test_task_id: str):
+            test_task_id: str,
+            test_manager: TestManager = None,
+            model_config: dict = None):
         super().__init__()
-        # 在主线程中获取模型配置
-        try:
-            models = db_manager.get_model_configs()
-            self.model_config = next(
-                (m for m in models if m["name"] == model_name), None)
-            if not self.model_config:
-                raise ValueError(f"找不到模型配置: {model_name}")
-        except Exception as e:
-            logger.error(f"获取模型配置失败: {e}")
-            self.model_config = None
+        # 调用方已提供模型配置时直接使用，否则在主线程中从数据库读取
+        self.model_config = model_config
+        if self.model_config is None:
+            try:
+                models = db_manager.get_model_configs()
+                self.model_config = next(
+                    (m for m in models if m["name"] == model_name), None)
+                if not self.model_config:
+                    raise ValueError(f"找不到模型配置: {model_name}")
+            except Exception as e:
+                logger.error(f"获取模型配置失败: {e}")
+                self.model_config = None
             
         self.tasks = tasks
         self.test_task_id = test_task_id
-        self.test_manager = TestManager()
-        # 连接信号
-        self.test_manager.result_received.connect(self.result_received)
+        self._last_progress_emit = 0.0
+        self._pending_progress = None  # 被节流、尚未发送的最新进度
+        # 待发送的结果，只在测试线程内读写，无需加锁
+        self._result_buffer = []
+        # 复用调用方的测试管理器，未提供时才自行创建
+        self.test_manager = test_manager or TestManager()
+        # 直接连接：结果在测试线程内缓存，由 _flush_loop 和 _progress_callback 分批发送
+        self.test_manager.result_received.connect(
+            self._buffer_result, Qt.ConnectionType.DirectConnection)
+        self._manager_connected = True
     
     def run(self):
         """运行测试线程"""
@@ -51,33 +68,106 @@ class TestThread(QThread):
                 
             logger.info("开始执行测试任务...")
             
-            # 创建事件循环
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # 运行测试
-            loop.run_until_complete(
-                self.test_manager.run_test(
-                    self.test_task_id,
-                    self.tasks,
-                    self._progress_callback,
-                    self.model_config
-                )
-            )
+            # 运行测试，asyncio.run负责创建事件循环，并在结束时清理异步生成器和关闭循环
+            asyncio.run(self._run_test())
+            logger.info("事件循环已关闭")
             
-            # 关闭事件循环
-            logger.info("正在关闭事件循环...")
-            loop.close()
+            # 发送剩余的结果和最终进度，保证在完成信号之前送达；
+            # 数据集的prompt少于并发数时完成数达不到总任务数，不能依赖回调发送最后一次进度
+            if self.test_manager.progress is not None:
+                self._emit_progress(self.test_manager.progress)
+            else:
+                self._flush_results()
             
             # 发送测试完成信号
             self.test_finished.emit()
             
         except Exception as e:
             logger.error(f"测试线程执行出错: {e}", exc_info=True)
+            if self._pending_progress is not None:
+                self._emit_progress(self._pending_progress)
+            else:
+                self._flush_results()
             self.test_error.emit(str(e))
         finally:
+            self.release_test_manager()
             logger.info("测试线程结束运行")
     
+    async def _run_test(self):
+        """运行测试，同时启动定时发送缓存结果和进度的协程"""
+        flusher = asyncio.create_task(self._flush_loop())
+        try:
+            await self.test_manager.run_test(
+                self.test_task_id,
+                self.tasks,
+                self._progress_callback,
+                self.model_config
+            )
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+    
+    async def _flush_loop(self):
+        """定时发送缓存的结果和被节流的进度
+
+        即使之后迟迟没有新的响应完成，缓存的结果也会在 RESULT_EMIT_INTERVAL 内送达，
+        被节流的最新进度也会在节流间隔到期后补发
+        """
+        while True:
+            await asyncio.sleep(self.RESULT_EMIT_INTERVAL)
+            if (self._pending_progress is not None
+                    and time.monotonic() - self._last_progress_emit
+                    >= self.PROGRESS_EMIT_INTERVAL):
+                self._emit_progress(self._pending_progress)
+            else:
+                self._flush_results()
+    
+    def release_test_manager(self):
+        """断开与测试管理器的信号连接
+
+        测试管理器可能被多次测试复用，线程结束后必须断开，避免结果被转发到旧线程
+        """
+        if self._manager_connected:
+            self._manager_connected = False
+            try:
+                self.test_manager.result_received.disconnect(
+                    self._buffer_result)
+            except TypeError:
+                pass
+    
+    def _buffer_result(self, dataset_name: str, response: APIResponse):
+        """缓存单个测试结果（在测试线程内调用）"""
+        self._result_buffer.append((dataset_name, response))
+    
+    def _flush_results(self):
+        """把缓存的结果作为一批发送"""
+        if not self._result_buffer:
+            return
+        batch, self._result_buffer = self._result_buffer, []
+        self.results_received.emit(batch)
+    
+    def _emit_progress(self, progress: TestProgress):
+        """发送进度
+
+        发送进度前先发送缓存的结果，保证界面先累加结果、再用进度中的计数覆盖，两者不会错位
+        """
+        self._flush_results()
+        self._pending_progress = None
+        self._last_progress_emit = time.monotonic()
+        self.progress_updated.emit(progress)
+    
     def _progress_callback(self, progress: TestProgress):
-        """进度回调函数"""
-        self.progress_updated.emit(progress) 
\ No newline at end of file
+        """进度回调函数，按时间节流
+
+        被节流的进度由 _flush_loop 补发，测试结束时 run() 再发送一次最终进度
+        """
+        completed = progress.successful_tasks + progress.failed_tasks
+        if (time.monotonic() - self._last_progress_emit
+                >= self.PROGRESS_EMIT_INTERVAL
+                or completed >= progress.total_tasks):
+            self._emit_progress(progress)
+        else:
+            self._pending_progress = progress 
\ No newline at end of file
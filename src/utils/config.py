@@ -39,7 +39,8 @@ DEFAULT_CONFIG = {
         "poll_interval": 0.5,  # GPU监控轮询间隔，单位秒
     },
     "gpu_monitor": {
-        "update_interval": 2.0,  # GPU监控更新间隔（秒）
+        "update_interval": 2.0,  # GPU监控轮询间隔（秒），GPUMonitorWidget 使用
+        "test_update_interval": 1.0,  # 测试运行期间的GPU监控轮询间隔（秒）
         "history_size": 60,      # 保存历史数据点数量
         "remote": {
             "enabled": False     # 默认使用本地监控